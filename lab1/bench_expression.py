@@ -0,0 +1,32 @@
+"""
+bench_expression.py — замер накладных расходов устойчивого режима.
+
+На «безопасных» входах (нет переполнения) evaluate_batch(stable=True)
+должен идти тем же быстрым путём float64, что и stable=False.
+Запуск: python bench_expression.py [размер]
+"""
+
+import sys
+import timeit
+
+import numpy as np
+
+from expression import evaluate_batch
+
+
+def main(argv):
+    size = int(argv[1]) if len(argv) > 1 else 1_000_000
+    rng = np.random.default_rng(0)
+    x = rng.uniform(0.01, 20.0, size)
+    n = rng.uniform(-8.0, 8.0, size)
+
+    plain = min(timeit.repeat(lambda: evaluate_batch(x, n, stable=False), number=3, repeat=5)) / 3
+    stable = min(timeit.repeat(lambda: evaluate_batch(x, n, stable=True), number=3, repeat=5)) / 3
+    print(f"элементов: {size}")
+    print(f"stable=False: {plain * 1e3:.1f} мс")
+    print(f"stable=True:  {stable * 1e3:.1f} мс")
+    print(f"накладные расходы: {(stable / plain - 1) * 100:+.1f}%")
+
+
+if __name__ == "__main__":
+    main(sys.argv)
@@ -0,0 +1,241 @@
+"""
+expression.py — вычисление выражения из части 1:
+sqrt( |cos x|**n + exp(n**3)/ln(x) + |sin x|**(1/n) )
+
+Вместо печати и раннего выхода для каждой пары (x, n) возвращается
+результат и код причины (OK или почему точка вне области определения).
+
+При больших |n| слагаемые считаются в логарифмической шкале, поэтому
+exp(n**3) не переполняется: результат конечен, пока сам корень
+помещается в float64, иначе — inf.
+"""
+
+import math
+import sys
+
+try:
+    import numpy as np
+except ImportError:  # скалярный evaluate() работает и без NumPy
+    np = None
+
+# Коды причин (по порядку проверок из ЛР1/ЛР2)
+OK = 0
+BAD_INPUT = 1         # x или n не конечные числа
+X_NOT_POSITIVE = 2    # x <= 0
+LN_ZERO = 3           # ln(x) = 0, т.е. x = 1
+N_ZERO = 4            # n = 0, 1/n не определено
+ZERO_NEG_POWER = 5    # 0 в отрицательной степени
+NEG_RADICAND = 6      # подкоренное выражение < 0
+OVERFLOW = 7          # только stable=False: слагаемое не помещается в float64
+
+MESSAGES = {
+    OK: "OK",
+    BAD_INPUT: "x и n должны быть конечными числами",
+    X_NOT_POSITIVE: "x должен быть > 0",
+    LN_ZERO: "ln(x) = 0, деление на 0 запрещено",
+    N_ZERO: "n должен быть != 0",
+    ZERO_NEG_POWER: "0 в отрицательной степени запрещён",
+    NEG_RADICAND: "подкоренное выражение < 0",
+    OVERFLOW: "переполнение при вычислении",
+}
+
+
+# ------------------------------ СКАЛЯРНО -------------------------------------
+
+def _logaddexp(a: float, b: float) -> float:
+    if a < b:
+        a, b = b, a
+    if b == -math.inf or a == math.inf:
+        return a
+    return a + math.log1p(math.exp(b - a))
+
+
+def _exp(v: float) -> float:
+    try:
+        return math.exp(v)
+    except OverflowError:
+        return math.inf
+
+
+def _log_abs(v: float) -> float:
+    v = math.fabs(v)
+    return math.log(v) if v > 0 else -math.inf
+
+
+def scalar_code(x: float, n: float) -> int:
+    if not (math.isfinite(x) and math.isfinite(n)):
+        return BAD_INPUT
+    if x <= 0:
+        return X_NOT_POSITIVE
+    if math.log(x) == 0.0:
+        return LN_ZERO
+    if n == 0:
+        return N_ZERO
+    if n < 0 and (math.sin(x) == 0 or math.cos(x) == 0):
+        return ZERO_NEG_POWER
+    return OK
+
+
+def _log_space(ln_x, log_cos, log_sin, n):
+    """
+    Корень по логарифмам слагаемых. Возвращает (результат, код).
+    |cos x|**n + |sin x|**(1/n) > 0 складываются через logaddexp,
+    exp(n**3)/ln(x) добавляется или вычитается по знаку ln(x).
+    """
+    lp = _logaddexp(n * log_cos, log_sin / n)
+    a2 = n * n * n - _log_abs(ln_x)
+    if ln_x > 0:
+        log_inside = _logaddexp(lp, a2)
+    else:
+        diff = a2 - lp
+        if diff > 0:
+            return math.nan, NEG_RADICAND
+        if diff == 0:
+            return 0.0, OK
+        log_inside = lp + math.log1p(-math.exp(diff))
+    return _exp(0.5 * log_inside), OK
+
+
+def evaluate(x: float, n: float):
+    """Одна пара (x, n) -> (результат, код). Без NumPy."""
+    code = scalar_code(x, n)
+    if code != OK:
+        return math.nan, code
+    ln_x = math.log(x)
+    c, s = math.fabs(math.cos(x)), math.fabs(math.sin(x))
+    try:
+        terms = (c ** n, math.exp(n ** 3) / ln_x, s ** (1.0 / n))
+    except OverflowError:
+        terms = (math.inf,)
+    inside = sum(terms)
+    # деление и сложение переполняются в inf без исключения — проверка, как в evaluate_batch
+    if not (all(map(math.isfinite, terms)) and math.isfinite(inside)):
+        return _log_space(ln_x, _log_abs(c), _log_abs(s), n)
+    if inside < 0:
+        return math.nan, NEG_RADICAND
+    return math.sqrt(inside), OK
+
+
+# ------------------------------ МАССИВЫ --------------------------------------
+
+def _require_numpy():
+    if np is None:
+        raise RuntimeError("Для пакетного вычисления нужен NumPy.")
+
+
+def domain_codes(x, n):
+    """Маски области определения: массив кодов той же формы, что и x, n."""
+    x, n = np.broadcast_arrays(np.asarray(x, dtype=np.float64),
+                               np.asarray(n, dtype=np.float64))
+    codes = np.zeros(x.shape, dtype=np.int8)
+
+    with np.errstate(all="ignore"):
+        ln_x = np.log(x)
+        checks = (
+            (BAD_INPUT, ~(np.isfinite(x) & np.isfinite(n))),
+            (X_NOT_POSITIVE, ~(x > 0)),
+            (LN_ZERO, ln_x == 0.0),
+            (N_ZERO, n == 0),
+            (ZERO_NEG_POWER, ((np.fabs(np.sin(x)) == 0) & (n < 0))
+                             | ((np.fabs(np.cos(x)) == 0) & (n < 0))),
+        )
+    # первая не прошедшая проверка определяет код
+    for code, bad in reversed(checks):
+        codes[bad] = code
+    return codes
+
+
+def _log_space_batch(ln_x, log_cos, log_sin, n):
+    """Векторный вариант _log_space: (результаты, коды)."""
+    lp = np.logaddexp(n * log_cos, log_sin / n)
+    a2 = n * n * n - np.log(np.fabs(ln_x))
+    diff = a2 - lp
+    neg = ln_x < 0
+    log_inside = np.where(neg, lp + np.log1p(-np.exp(np.minimum(diff, 0.0))),
+                          np.logaddexp(lp, a2))
+    values = np.exp(0.5 * log_inside)
+    codes = np.where(neg & (diff > 0), NEG_RADICAND, OK).astype(np.int8)
+    return np.where(codes == OK, values, np.nan), codes
+
+
+def evaluate_batch(x, n, grid: bool = False, stable: bool = True):
+    """
+    Вычисляет выражение для массивов x и n.
+    grid=True — все сочетания (результат формы len(x) x len(n)),
+    иначе x и n транслируются по правилам NumPy.
+    stable=False — только прямой расчёт в float64, переполнение -> код OVERFLOW;
+    при stable=True такие элементы пересчитываются в логарифмической шкале.
+    Возвращает (results, codes); там, где код != OK, результат — nan.
+    """
+    _require_numpy()
+    x = np.asarray(x, dtype=np.float64)
+    n = np.asarray(n, dtype=np.float64)
+    if grid:
+        x, n = x.reshape(-1, 1), n.reshape(1, -1)
+    x, n = np.broadcast_arrays(x, n)
+
+    codes = domain_codes(x, n)
+    ok = codes == OK
+    xs, ns = x[ok], n[ok]
+
+    with np.errstate(all="ignore"):
+        ln_x = np.log(xs)
+        c, s = np.fabs(np.cos(xs)), np.fabs(np.sin(xs))
+        term1 = c ** ns
+        term2 = np.exp(ns ** 3) / ln_x
+        term3 = s ** (1.0 / ns)
+        inside = term1 + term2 + term3
+        values = np.sqrt(inside)
+
+        sub = np.where(inside < 0, NEG_RADICAND, OK).astype(np.int8)
+        over = ~(np.isfinite(term1) & np.isfinite(term2) & np.isfinite(term3) & np.isfinite(inside))
+        if over.any():
+            # быстрый путь остаётся для «безопасных» элементов,
+            # в лог-шкале пересчитываются только переполнившиеся
+            if stable:
+                values[over], sub[over] = _log_space_batch(
+                    ln_x[over], np.log(c[over]), np.log(s[over]), ns[over])
+            else:
+                sub[over] = OVERFLOW
+    codes[ok] = sub
+
+    results = np.full(x.shape, np.nan)
+    results[ok] = np.where(sub == OK, values, np.nan)
+    return results, codes
+
+
+def load_pairs(path: str):
+    """Читает пары (x, n) из .npy (массив N x 2) или CSV (столбцы x,n; заголовок допустим)."""
+    _require_numpy()
+    if path.endswith(".npy"):
+        data = np.load(path)
+    else:
+        try:
+            data = np.loadtxt(path, delimiter=",", ndmin=2)
+        except ValueError:
+            data = np.loadtxt(path, delimiter=",", ndmin=2, skiprows=1)
+    data = np.asarray(data, dtype=np.float64)
+    if data.ndim != 2 or data.shape[1] != 2:
+        raise ValueError("Ожидается массив из двух столбцов: x, n.")
+    return data[:, 0], data[:, 1]
+
+
+def evaluate_file(path: str):
+    x, n = load_pairs(path)
+    return x, n, *evaluate_batch(x, n)
+
+
+def main(argv):
+    if len(argv) != 2:
+        print("Использование: python expression.py pairs.csv|pairs.npy", file=sys.stderr)
+        return 2
+    x, n, results, codes = evaluate_file(argv[1])
+    out = sys.stdout
+    out.write("x,n,result,code\n")
+    for row in zip(x.tolist(), n.tolist(), results.tolist(), codes.tolist()):
+        out.write("%r,%r,%r,%d\n" % row)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -0,0 +1,128 @@
+"""
+list_script.py — массовая загрузка и неинтерактивный режим части 2.
+
+Файл данных (или канал) — по одному элементу на строку, в одном из видов:
+    int:5    float:2.5    bool:true    str:любой текст
+    JSONL:   5    2.5    true    "текст"    {"type": "int", "value": "5"}
+Строки разбираются пачками и добавляются в список целиком.
+
+Файл команд — по одной операции меню на строку:
+    add int:5              — добавить элемент (та же запись, что в файле данных)
+    load data.txt          — массовая загрузка ("-" — stdin)
+    remove 5               — удалить первое вхождение (по строковой форме)
+    show                   — показать список
+    floats                 — кортеж положительных float
+    product                — произведение int
+    count w1 w2 ...        — сколько раз каждое слово встречается в строке
+                             из элементов (только целые слова)
+    countsub w1 w2 ...     — то же, но с вхождениями внутри слов (как str.count)
+    phrase текст           — сколько раз встречается фраза целиком (целые слова)
+    phrasesub текст        — то же, как str.count
+    symdiff a b c          — симметрическая разница M1 = {a, b, c} и M2
+    symdiff_lines a b c    — то же, по одному элементу на строку
+    odd                    — элементы словаря с нечётными ключами
+Пустые строки и строки с # пропускаются; результаты пишутся в stdout.
+"""
+
+import json
+import sys
+from itertools import islice
+
+from typed_list import TypedList, parse_typed, TYPES
+
+BATCH_SIZE = 10_000
+
+
+def parse_item(line: str):
+    """Один элемент из строки вида type:value или JSON."""
+    t, sep, v = line.partition(":")
+    if sep and t.strip().lower() in TYPES:
+        return parse_typed(t.strip().lower(), v)
+    try:
+        value = json.loads(line)
+    except json.JSONDecodeError:
+        raise ValueError(f"не удалось разобрать элемент {line!r}.")
+    if isinstance(value, dict):
+        return parse_typed(str(value.get("type", "")).lower(), str(value.get("value", "")))
+    if not isinstance(value, (int, float, str, bool)):
+        raise ValueError(f"неподдерживаемый тип элемента {line!r}.")
+    return value
+
+
+def _data_lines(lines):
+    for line in lines:
+        line = line.rstrip("\r\n")
+        if line.strip() and not line.lstrip().startswith("#"):
+            yield line
+
+
+def load_items(lst: TypedList, lines, batch_size: int = BATCH_SIZE) -> int:
+    """Добавляет элементы из строк пачками по batch_size. Возвращает их число."""
+    it = _data_lines(lines)
+    count = 0
+    while True:
+        batch = [parse_item(line) for line in islice(it, batch_size)]
+        if not batch:
+            return count
+        lst.extend(batch)
+        count += len(batch)
+
+
+def load_file(lst: TypedList, path: str) -> int:
+    if path == "-":
+        return load_items(lst, sys.stdin)
+    with open(path, "r", encoding="utf-8") as f:
+        return load_items(lst, f)
+
+
+def run_command(lst: TypedList, line: str, out) -> None:
+    cmd, _, arg = line.strip().partition(" ")
+    cmd = cmd.lower()
+    if cmd == "add":
+        lst.append(parse_item(arg))
+        print("Элемент добавлен.", file=out)
+    elif cmd == "load":
+        print(f"Загружено элементов: {load_file(lst, arg.strip())}", file=out)
+    elif cmd == "remove":
+        removed = lst.remove_first(arg)
+        if removed:
+            print(f"Удалён элемент {removed[1]} (позиция {removed[0]}).", file=out)
+        else:
+            print("Элемент не найден в списке.", file=out)
+    elif cmd == "show":
+        print("Список:", lst, file=out)
+    elif cmd == "floats":
+        print("Кортеж из положительных вещественных элементов:", lst.positive_floats(), file=out)
+    elif cmd == "product":
+        if lst.has_ints():
+            print("Произведение целочисленных элементов:", lst.int_product(), file=out)
+        else:
+            print("Целочисленные (int) элементы не найдены.", file=out)
+    elif cmd in ("count", "countsub"):
+        for word, count in lst.count_words(arg.split(), substring=(cmd == "countsub")).items():
+            print(f"Слово '{word}' встречается в строке {count} раз(а).", file=out)
+    elif cmd in ("phrase", "phrasesub"):
+        count = lst.count_word(arg, substring=(cmd == "phrasesub"))
+        print(f"Фраза '{arg}' встречается в строке {count} раз(а).", file=out)
+    elif cmd == "symdiff":
+        print("Симметрическая разница M1 и M2 =", lst.sym_diff(arg.split()), file=out)
+    elif cmd == "symdiff_lines":
+        out.writelines(f"{e}\n" for e in lst.iter_sym_diff(set(arg.split())))
+    elif cmd == "odd":
+        out.writelines(f"{k}: {e}\n" for k, e in lst.positions(parity=1).items())
+    else:
+        raise ValueError(f"неизвестная команда {cmd!r}.")
+
+
+def run_script(lst: TypedList, lines, out=sys.stdout) -> int:
+    """Выполняет команды; ошибка в строке печатается и не прерывает скрипт. Возвращает число ошибок."""
+    errors = 0
+    for lineno, line in enumerate(lines, 1):
+        if not line.strip() or line.lstrip().startswith("#"):
+            continue
+        try:
+            run_command(lst, line.rstrip("\r\n"), out)
+        except (ValueError, OSError) as e:
+            errors += 1
+            print(f"Ошибка (строка {lineno}): {e}", file=out)
+    return errors
@@ -1,37 +1,28 @@
-import math
+import argparse
+import os
 import sys
+from itertools import islice
+
+from expression import evaluate, MESSAGES, OK
+
+# общий модуль площадей лежит в ЛР2
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "lab2"))
+import areas
+from typed_list import TypedList, parse_typed
+from list_script import load_file, run_script
 
 def part1_expression():
     try:
         x = float(input("Введите x: "))
         n = float(input("Введите n: "))
 
-        if x <= 0:
-            print("Error: введите x > 0!")
-            return
-
-        if n == 0:
-            print("Error: введите n != 0")
-            return
-
         # sqrt( |cos x|**n + exp(n**3)/ln(x) + |sin x|**(1/n) )
-        term1 = abs(math.cos(x)) ** n
-
-        ln_x = math.log(x)
-        if ln_x == 0:
-            print("Error: ln(x) = 0, деление на 0 запрещено.")
-            return
-
-        term2 = math.exp(n ** 3) / ln_x
-        term3 = abs(math.sin(x)) ** (1.0 / n)
-
-        inside = term1 + term2 + term3
-
-        if inside < 0:
-            print("Error: подкоренное выражение < 0.")
+        # при больших n считается в лог-шкале, без OverflowError
+        result, code = evaluate(x, n)
+        if code != OK:
+            print(f"Error: {MESSAGES[code]}.")
             return
 
-        result = math.sqrt(inside)
         print(f"Результат: {result}")
 
     except ValueError:
@@ -40,39 +31,42 @@ def part1_expression():
         print("Произошла Error:", str(e))
 
 
+VALUE_PROMPTS = {
+    "int": "Введите int число: ",
+    "float": "Введите float число: ",
+    "bool": "Введите bool значение: ",
+    "str": "Введите строку: ",
+}
+
+
 def input_typed_value():
     t = input("Выберите тип добавляемого элемента (int, float, str, bool): ").lower()
-    if t == "int":
-        v = input("Введите int число: ")
-        try:
-            return int(v)
-        except ValueError:
-            raise ValueError("Неверное int число.")
-    elif t == "float":
-        v = input("Введите float число: ")
-        try:
-            return float(v)
-        except ValueError:
-            raise ValueError("Неверное float число.")
-    elif t == "bool":
-        v = input("Введите bool значение: ").lower()
-        if v in ("true", "t", "1"):
-            return True
-        elif v in ("false", "f", "0"):
-            return False
-        else:
-            raise ValueError("Неверное bool значение.")
-    elif t == "str":
-        v = input("Введите строку: ")
-        return v
-    else:
+    if t not in VALUE_PROMPTS:
         raise ValueError("Неизвестный тип данных.")
+    return parse_typed(t, input(VALUE_PROMPTS[t]))
 
 
-def part2_list_manager():
-    lst = []
+YES = ("y", "yes", "д", "да")
+SHOW_LIMIT = 50  # больше элементов множества M2 на экран не выводим
+PAGE_SIZE = 20
+
+
+def print_pages(view, size=PAGE_SIZE):
+    """Печатает отображение постранично, пока пользователь просит дальше."""
+    pages = view.pages(size)
+    for number in range(pages):
+        for k, v in view.page(number, size):
+            print(f"{k}: {v}")
+        print(f"-- страница {number + 1} из {pages}, всего {len(view)} --")
+        if number + 1 < pages and input("Enter — следующая страница, любой ввод — хватит: ").strip():
+            break
+
+
+def part2_list_manager(lst=None):
+    if lst is None:
+        lst = TypedList()
     while True:
-        print("\nТекущее содержимое списка:", lst)
+        print("\nТекущее содержимое списка:", lst.preview())
         print("\nМеню (выберите номер операции):")
         print("1) Показать значения списка на экране")
         print("2) Добавление нового элемента в конец списка (разных типов)")
@@ -101,71 +95,56 @@ def part2_list_manager():
                 print("Список пуст, нечего удалять.")
                 continue
             to_remove = input("Введите элемент для удаления: ")
-            removed = False
-            candidates = []
-            for i, e in enumerate(lst):
-                if str(e) == to_remove:
-                    candidates.append(i)
-            if candidates:
-                idx = candidates[0]
-                print(f"Удалить элемент {lst[idx]} (позиция {idx}).")
-                lst.pop(idx)
-                removed = True
+            removed = lst.remove_first(to_remove)
+            if removed:
+                idx, value = removed
+                print(f"Удалить элемент {value} (позиция {idx}).")
             else:
                 print("Элемент не найден в списке.")
 
         elif choice == "4":
-            tup = tuple(e for e in lst if isinstance(e, float) and e > 0)
+            tup = lst.positive_floats()
             print("Кортеж из положительных вещественных элементов:", tup)
 
         elif choice == "5":
-            prod = 1
-            found = False
-            for e in lst:
-                if isinstance(e, int) and not isinstance(e, bool):
-                    prod *= e
-                    found = True
-            if found:
-                print("Произведение целочисленных элементов:", prod)
+            if lst.has_ints():
+                print("Произведение целочисленных элементов:", lst.int_product())
             else:
                 print("Целочисленные (int) элементы не найдены.")
 
         elif choice == "6":
-            s = " ".join(str(e) for e in lst)
-            print("Сформированная строка:", s)
-            word = input("Введите слово для подсчёта в этой строке: ")
-            count = s.count(word)
-            print(f"Слово '{word}' встречается в строке {count} раз(а).")
+            print("Сформированная строка:", " ".join(str(e) for e in islice(lst, 20)),
+                  "..." if len(lst) > 20 else "")
+            query = input("Введите слово или фразу для подсчёта в этой строке: ")
+            substring = input("Считать вхождения внутри слов? (y/N): ").strip().lower() in YES
+            # фраза считается целиком; по словам — только если попросили
+            words = [query]
+            if len(query.split()) > 1 and input("Посчитать каждое слово отдельно? (y/N): ").strip().lower() in YES:
+                words = query.split()
+            for word, count in lst.count_words(words, substring).items():
+                print(f"Слово '{word}' встречается в строке {count} раз(а).")
 
         elif choice == "7":
             s = input("Введите элементы множества M1 через пробел: ")
-            if s == "":
-                M1 = set()
-            else:
-                M1 = set(s.split())
-            M2 = set()
-            for e in lst:
-                try:
-                    M2.add(str(e))
-                except Exception:
-                    pass
-            sym_diff = (M1 ^ M2)
+            M1 = set(s.split())
+            M2 = lst.str_forms()
             print("M1 =", M1)
-            print("M2 =", M2)
-            print("Симметрическая разница M1 и M2 =", sym_diff)
+            print("M2 =", set(M2) if len(M2) <= SHOW_LIMIT else f"<{len(M2)} элементов>")
+            if input("Выводить симметрическую разницу построчно? (y/N): ").strip().lower() in YES:
+                print("Симметрическая разница M1 и M2:")
+                count = 0
+                for e in lst.iter_sym_diff(M1):
+                    print(e)
+                    count += 1
+                print(f"Всего: {count}")
+            else:
+                print("Симметрическая разница M1 и M2 =", lst.sym_diff(M1))
 
         elif choice == "8":
-            d = {}
-            for i in range(len(lst)):
-                d[i + 1] = lst[i]
-
-            print("Словарь:")
-            for k, v in d.items():
-                print(f"{k}: {v}")
+            print(f"Словарь: {len(lst.positions())} элементов (ключ = позиция, начиная с 1)")
+            print_pages(lst.positions())
             print("\nЭлементы словаря с нечетными значениями ключа:")
-            for k, v in d.items():
-                if k % 2 == 1:
-                    print(f"{k}: {v}")
+            print_pages(lst.positions(parity=1))
 
         elif choice == "9":
             print("Выход в главное меню.")
@@ -175,6 +154,16 @@ def part2_list_manager():
 
 
 def part3_areas():
+    # формулы и проверки — общие с ЛР2 (lab2/areas.py)
+    prompts = {
+        "S": ("Введите сторону квадрата: ",),
+        "T": ("Введите первую основу трапеции: ",
+              "Введите вторую основу трапеции: ",
+              "Введите высоту трапеции: "),
+        "P": ("Введите основание параллелограмма: ",
+              "Введите высоту (положительное число): "),
+    }
+    names = {"S": "квадрата", "T": "трапеции", "P": "параллелограмма"}
     while True:
         print("\nВыберите фигуру:")
         print("S - площадь квадрата")
@@ -183,47 +172,22 @@ def part3_areas():
         print("E - выход в главное меню")
         choice = input("Ваш выбор (S/T/P/E): ").upper()
 
-        if choice == "S":
-            a_str = input("Введите сторону квадрата: ")
+        if choice in prompts:
+            values = [input(p) for p in prompts[choice]]
             try:
-                a = float(a_str)
-                if a <= 0:
-                    print("Error: сторона должна быть положительной.")
-                else:
-                    area = a * a
-                    print(f"Площадь квадрата: {area}")
+                nums = [float(v) for v in values]
             except ValueError:
                 print("Error: введено не число.")
-
-        elif choice == "T":
-            a_str = input("Введите первую основу трапеции: ")
-            b_str = input("Введите вторую основу трапеции: ")
-            h_str = input("Введите высоту трапеции: ")
-            try:
-                a = float(a_str)
-                b = float(b_str)
-                h = float(h_str)
-                if h <= 0:
-                    raise ValueError
-                else:
-                    area = (a + b) / 2.0 * h
-                    print(f"Площадь трапеции: {area}")
-            except ValueError:
-                print("Error: введены неверные числа.")
-
-        elif choice == "P":
-            base_str = input("Введите основание параллелограмма: ")
-            h_str = input("Введите высоту (положительное число): ")
+                continue
+            # (a, b, h): у квадрата только a, у параллелограмма a и h
+            if choice == "P":
+                nums = [nums[0], None, nums[1]]
             try:
-                base = float(base_str)
-                h = float(h_str)
-                if h <= 0:
-                    print("Error: высота должна быть положительной.")
-                else:
-                    area = base * h
-                    print(f"Площадь параллелограмма: {area}")
-            except ValueError:
-                print("Error: введены неверные числа.")
+                area = areas.area(choice, *nums)
+            except ValueError as e:
+                print(f"Error: {e}")
+                continue
+            print(f"Площадь {names[choice]}: {area}")
 
         elif choice == "E":
             print("Выход в главное меню.")
@@ -254,5 +218,35 @@ def main_menu():
             print("Неверный выбор (1-4)")
 
 
+def run_cli(argv):
+    parser = argparse.ArgumentParser(description="Часть 2 без меню: массовая загрузка и скрипт команд.")
+    parser.add_argument("--load", action="append", default=[], metavar="FILE",
+                        help="файл элементов (type:value или JSONL), '-' — stdin; можно несколько")
+    parser.add_argument("--script", metavar="FILE",
+                        help="файл команд, '-' — stdin; без него открывается меню списка")
+    args = parser.parse_args(argv)
+
+    lst = TypedList()
+    try:
+        for path in args.load:
+            print(f"Загружено элементов из {path}: {load_file(lst, path)}", file=sys.stderr)
+    except (ValueError, OSError) as e:
+        print(f"Ошибка загрузки: {e}", file=sys.stderr)
+        return 1
+
+    if args.script is None:
+        part2_list_manager(lst)
+        return 0
+    if args.script == "-":
+        return 1 if run_script(lst, sys.stdin) else 0
+    with open(args.script, "r", encoding="utf-8") as f:
+        return 1 if run_script(lst, f) else 0
+
+
 if __name__ == "__main__":
+    # произведение int на больших списках легко превышает лимит int -> str
+    if hasattr(sys, "set_int_max_str_digits"):
+        sys.set_int_max_str_digits(0)
+    if len(sys.argv) > 1:
+        sys.exit(run_cli(sys.argv[1:]))
     main_menu()
@@ -0,0 +1,339 @@
+"""
+typed_list.py — список разнотипных элементов с индексами для меню части 2.
+
+Индексы обновляются при добавлении и удалении, поэтому запросы меню
+не просматривают весь список:
+    - элементы по типам и положительные float (пункт 4);
+    - произведение int (пункт 5) ведётся по мере добавления, новые
+      множители перемножаются пачкой при запросе;
+    - строковые формы элементов со всеми их вхождениями по порядку
+      (первое вхождение — пункт 3, множество M2 — пункт 7);
+    - слова строки из элементов с числом повторений (пункт 6);
+    - дерево Фенвика по ячейкам даёт позицию элемента и k-й элемент
+      за O(log n) без сдвига списка при удалении; на нём же построено
+      ленивое отображение позиция -> элемент (пункт 8).
+"""
+
+from collections import Counter, deque
+from collections.abc import Mapping
+from itertools import islice
+
+TYPES = ("int", "float", "str", "bool")
+
+
+def parse_typed(t: str, v: str):
+    """Значение v типа t (int, float, str, bool) из строки."""
+    if t == "int":
+        try:
+            return int(v)
+        except ValueError:
+            raise ValueError("Неверное int число.")
+    elif t == "float":
+        try:
+            return float(v)
+        except ValueError:
+            raise ValueError("Неверное float число.")
+    elif t == "bool":
+        v = v.lower()
+        if v in ("true", "t", "1"):
+            return True
+        elif v in ("false", "f", "0"):
+            return False
+        else:
+            raise ValueError("Неверное bool значение.")
+    elif t == "str":
+        return v
+    else:
+        raise ValueError("Неизвестный тип данных.")
+
+
+class Positions:
+    """
+    Дерево Фенвика по ячейкам (1 — занята, 0 — удалена), растёт с конца.
+    Его же использует реестр преподавателей ЛР3 (lab3/registry.py).
+    """
+
+    def __init__(self):
+        self._tree = [0]  # индексация с 1
+
+    def __len__(self) -> int:
+        return len(self._tree) - 1
+
+    def _prefix(self, i: int) -> int:
+        total = 0
+        tree = self._tree
+        while i > 0:
+            total += tree[i]
+            i &= i - 1
+        return total
+
+    def append(self) -> None:
+        # узел i покрывает (i - lowbit(i), i]: это он сам и его дочерние
+        # узлы i-1, i-2, i-4, ...; в среднем их O(1)
+        tree = self._tree
+        i = len(tree)
+        total, step, low = 1, 1, i & -i
+        while step < low:
+            total += tree[i - step]
+            step <<= 1
+        tree.append(total)
+
+    def clear(self, slot: int) -> None:
+        i = slot + 1
+        tree = self._tree
+        while i < len(tree):
+            tree[i] -= 1
+            i += i & -i
+
+    def rank(self, slot: int) -> int:
+        """Сколько занятых ячеек перед slot (= позиция элемента в списке)."""
+        return self._prefix(slot)
+
+    def find(self, k: int) -> int:
+        """Ячейка k-го (с 0) занятого элемента."""
+        tree = self._tree
+        i = 0
+        step = 1 << (len(tree).bit_length() - 1)
+        while step:
+            j = i + step
+            if j < len(tree) and tree[j] <= k:
+                i = j
+                k -= tree[j]
+            step >>= 1
+        return i
+
+
+class PositionView(Mapping):
+    """
+    Словарь «позиция (с 1) -> элемент» поверх TypedList без копирования.
+    parity=1 — только нечётные ключи, 0 — только чётные, None — все.
+    """
+
+    def __init__(self, lst: "TypedList", parity=None):
+        self._lst = lst
+        self._parity = parity
+
+    def _first(self) -> int:
+        return 2 if self._parity == 0 else 1
+
+    def _step(self) -> int:
+        return 1 if self._parity is None else 2
+
+    def __len__(self) -> int:
+        n = len(self._lst)
+        first = self._first()
+        return 0 if n < first else (n - first) // self._step() + 1
+
+    def __getitem__(self, key: int):
+        if not (isinstance(key, int) and 1 <= key <= len(self._lst)
+                and (self._parity is None or key % 2 == self._parity)):
+            raise KeyError(key)
+        return self._lst[key - 1]
+
+    def __iter__(self):
+        return iter(range(self._first(), len(self._lst) + 1, self._step()))
+
+    def items(self):
+        # один проход по списку вместо поиска каждого ключа
+        values = islice(self._lst, self._first() - 1, None, self._step())
+        return zip(self, values)
+
+    def page(self, number: int, size: int = 20) -> list:
+        """Страница number (с 0): не больше size пар (ключ, элемент)."""
+        keys = range(self._first(), len(self._lst) + 1, self._step())[number * size:(number + 1) * size]
+        return [(k, self._lst[k - 1]) for k in keys]
+
+    def pages(self, size: int = 20) -> int:
+        return -(-len(self) // size)
+
+
+class TypedList:
+    def __init__(self, values=()):
+        self._items = {}       # ячейка -> значение, в порядке добавления
+        self._pos = Positions()
+        self._by_type = {}     # тип -> {ячейка: значение}
+        self._pos_floats = {}  # ячейка -> float > 0
+        self._by_str = {}      # str(значение) -> deque ячеек по порядку
+        self._int_product = 1  # произведение ненулевых int (без bool)
+        self._int_pending = []  # ещё не умноженные множители
+        self._int_zeros = 0
+        self._words = Counter()  # слово -> сколько раз встречается
+        self.extend(values)
+
+    # ---------------------------- изменение ----------------------------------
+
+    def extend(self, values) -> None:
+        append = self.append
+        for v in values:
+            append(v)
+
+    def append(self, value) -> None:
+        slot = len(self._pos)
+        self._pos.append()
+        self._items[slot] = value
+        self._by_type.setdefault(type(value), {})[slot] = value
+        if type(value) is float and value > 0:
+            self._pos_floats[slot] = value
+        elif type(value) is int:
+            if value == 0:
+                self._int_zeros += 1
+            else:
+                self._int_pending.append(value)
+        key = str(value)
+        ids = self._by_str.get(key)
+        if ids is None:
+            self._by_str[key] = ids = deque()
+        ids.append(slot)
+        self._words.update(key.split())
+
+    def remove_first(self, text: str):
+        """
+        Удаляет первое вхождение элемента со строковой формой text.
+        Возвращает (позиция, значение) или None, если такого нет.
+        """
+        ids = self._by_str.get(text)
+        if not ids:
+            return None
+        slot = ids.popleft()
+        if not ids:
+            del self._by_str[text]
+        position = self._pos.rank(slot)
+        self._pos.clear(slot)
+        value = self._items.pop(slot)
+        by_type = self._by_type[type(value)]
+        del by_type[slot]
+        if not by_type:
+            del self._by_type[type(value)]
+        self._pos_floats.pop(slot, None)
+        if type(value) is int:
+            if value == 0:
+                self._int_zeros -= 1
+            else:
+                self._int_product = self._flush_product() // value
+        words = self._words
+        for w in text.split():
+            words[w] -= 1
+            if not words[w]:
+                del words[w]
+        return position, value
+
+    # ---------------------------- запросы ------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(self._items.values())
+
+    def __getitem__(self, index: int):
+        if index < 0:
+            index += len(self._items)
+        if not 0 <= index < len(self._items):
+            raise IndexError("индекс вне списка")
+        return self._items[self._pos.find(index)]
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+    def positions(self, parity=None) -> PositionView:
+        return PositionView(self, parity)
+
+    def preview(self, limit: int = 20) -> str:
+        """Начало списка для заголовка меню (не печатаем миллион элементов)."""
+        if len(self) <= limit:
+            return repr(self)
+        head = ", ".join(repr(self[i]) for i in range(limit))
+        return f"[{head}, ...] (всего {len(self)})"
+
+    def of_type(self, tp):
+        return list(self._by_type.get(tp, {}).values())
+
+    def positive_floats(self) -> tuple:
+        return tuple(self._pos_floats.values())
+
+    def has_ints(self) -> bool:
+        return int in self._by_type
+
+    def _flush_product(self) -> int:
+        # множители перемножаются попарно (дерево произведений): для больших
+        # чисел это гораздо быстрее, чем умножать накопленное по одному
+        factors = self._int_pending
+        if factors:
+            factors.append(self._int_product)
+            while len(factors) > 1:
+                factors = [factors[i] * factors[i + 1] if i + 1 < len(factors) else factors[i]
+                           for i in range(0, len(factors), 2)]
+            self._int_product = factors[0]
+            self._int_pending = []
+        return self._int_product
+
+    def int_product(self) -> int:
+        return 0 if self._int_zeros else self._flush_product()
+
+    def str_forms(self):
+        """
+        Множество строковых форм элементов (M2), без копирования.
+        Форма остаётся в M2, пока жива хотя бы одна её копия
+        (длина очереди вхождений — счётчик ссылок).
+        """
+        return self._by_str.keys()
+
+    def iter_sym_diff(self, m1):
+        """
+        Элементы M1 ^ M2 по одному. Стоимость O(|M1| + размер результата):
+        каждая форма из M2, не попавшая в результат, есть в M1.
+        """
+        m2 = self._by_str
+        for e in m1:
+            if e not in m2:
+                yield e
+        for e in m2:
+            if e not in m1:
+                yield e
+
+    def sym_diff(self, m1) -> set:
+        m1 = m1 if isinstance(m1, (set, frozenset)) else set(m1)
+        return set(self.iter_sym_diff(m1))
+
+    def first_position(self, text: str):
+        ids = self._by_str.get(text)
+        return self._pos.rank(ids[0]) if ids else None
+
+    def count_words(self, words, substring: bool = False) -> dict:
+        """
+        Сколько раз каждое из words встречается в строке " ".join(элементы),
+        без построения самой строки. words — слова или фразы из нескольких слов.
+        substring=False — только целые слова (cat не считается в concat),
+        фраза — как подряд идущие целые слова;
+        substring=True — как str.count, вхождения внутри слов тоже.
+        """
+        result = {}
+        scan = []
+        for word in words:
+            if not substring:
+                tokens = word.split()
+                if len(tokens) > 1:
+                    # фраза может пересекать границы элементов — проход по словам
+                    result[word] = self._count_phrase(tokens)
+                else:
+                    result[word] = self._words.get(word.strip(), 0) if tokens else 0
+            elif word and word.split() == [word]:
+                # вхождение без пробельных символов не может пересечь границу слова
+                result[word] = 0
+                scan.append(word)
+            else:
+                result[word] = " ".join(map(str, self)).count(word)
+        if scan:
+            for token, n in self._words.items():
+                for word in scan:
+                    if word in token:
+                        result[word] += token.count(word) * n
+        return result
+
+    def _count_phrase(self, tokens) -> int:
+        seq = [t for e in self for t in str(e).split()]
+        first, k = tokens[0], len(tokens)
+        return sum(1 for i, t in enumerate(seq) if t == first and seq[i:i + k] == tokens)
+
+    def count_word(self, word: str, substring: bool = False) -> int:
+        return self.count_words((word,), substring)[word]
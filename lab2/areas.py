@@ -0,0 +1,99 @@
+"""
+areas.py — площади фигур S/T/P: формулы и проверки в одном месте.
+
+Используется интерактивным меню ЛР1 (часть 3), Заданием 2 ЛР2,
+потоковым (stream.py) и столбцовым (columnar.py) режимами.
+Правило проверки единое: все параметры, нужные фигуре, должны быть
+положительными и конечными.
+
+    area(code, a, b, h)              — одна фигура
+    areas_list(codes, a, b, h)       — списки; большие входы из float
+                                       считаются через areas_array
+    areas_array(codes, a, b, h)      — массивы NumPy (columnar.py)
+"""
+
+from itertools import islice
+from math import isfinite
+
+S = lambda a, *_: a*a
+T = lambda a, b, h, *_: (a + b) * h / 2.0
+P = lambda a, _, h, *__: a * h
+op = {'S': S, 'T': T, 'P': P}
+
+# какие из (a, b, h) нужны фигуре
+need_mask = { 'S': (1,0,0), 'T': (1,1,1), 'P': (1,0,1) }
+
+# с какого размера areas_list считает через NumPy (bench_areas.py: на 10^4
+# записей столбцовый путь вместе с переводом списков в массивы уже в ~3.5 раза
+# быстрее цикла, на 10^6 — тоже).
+# Процессов для больших входов нет: передача списков рабочим (pickle) дороже
+# самого расчёта — на 10^6 записей 4 процесса медленнее цикла (2.88 с против
+# 1.95 с), а при spawn/forkserver каждый рабочий заново импортирует __main__.
+ARRAY_THRESHOLD = 10_000
+
+is_pos = lambda t: (t is not None) and isfinite(t) and (t > 0)
+
+
+def check(code, a=None, b=None, h=None) -> None:
+    if code not in op:
+        raise ValueError(f"неизвестный код фигуры {code!r} (допустимы: S, T, P).")
+    if not all(is_pos(v) for v, need in zip((a, b, h), need_mask[code]) if need):
+        raise ValueError("параметры должны быть положительными и конечными.")
+
+
+def area(code, a=None, b=None, h=None):
+    """Площадь одной фигуры с проверкой параметров."""
+    check(code, a, b, h)
+    return op[code](a, b, h)
+
+
+def _areas_chunk(offset, codes, a, b, h):
+    out = []
+    for i, args in enumerate(zip(codes, a, b, h)):
+        try:
+            out.append(area(*args))
+        except ValueError as e:
+            raise ValueError(f"запись {offset + i}: {e}") from None
+    return out
+
+
+def _only_floats(count, *seqs) -> bool:
+    # float64 в NumPy считает то же, что float в Python, бит в бит;
+    # int (точная арифметика), строки и прочее — только циклом
+    return all(set(map(type, islice(seq, count))) <= {float, type(None)} for seq in seqs)
+
+
+def areas_list(codes, a, b, h):
+    """
+    Площади по спискам одинаковой длины. Ошибка указывает номер записи.
+    Результат при любом размере тот же, что у цикла по area(): начиная
+    с ARRAY_THRESHOLD записей через areas_array считаются только входы,
+    где все параметры — float (или None), и только если есть NumPy.
+    """
+    count = len(codes)
+    if not (len(a) >= count and len(b) >= count and len(h) >= count):
+        raise ValueError("недостаточно числовых данных под операции.")
+    if count >= ARRAY_THRESHOLD and _only_floats(count, a, b, h):
+        try:
+            return areas_array(codes, a, b, h).tolist()
+        except ImportError:
+            pass
+        except ValueError:
+            # неверная запись: цикл ниже сообщит о первой из них, как без NumPy
+            pass
+    return _areas_chunk(0, codes, a, b, h)
+
+
+def areas_array(codes, a, b, h):
+    """Площади по массивам через столбцовое ядро (нужен NumPy)."""
+    from columnar import to_columns, unknown_codes, bad_records, columnar_areas
+
+    codes, a, b, h = to_columns(codes, a, b, h, stop=len(codes))
+    unknown = unknown_codes(codes)
+    if unknown.size:
+        raise ValueError(f"неизвестный код фигуры (допустимы: S, T, P) в записях {unknown[:10].tolist()}.")
+    bad = bad_records(codes, a, b, h)
+    if bad.size:
+        raise ValueError("параметры должны быть положительными и конечными "
+                         f"(записи {bad[:10].tolist()}, всего {bad.size}).")
+    return columnar_areas(codes, a, b, h)
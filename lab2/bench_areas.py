@@ -0,0 +1,53 @@
+"""
+bench_areas.py — сравнение скалярных лямбд S/T/P и столбцового расчёта.
+
+Запуск: python bench_areas.py [макс. степень 10, по умолчанию 7]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from columnar import columnar_areas, bad_records, to_columns
+from areas import op
+
+
+def scalar_path(codes, streams):
+    take_i  = lambda i: tuple(map(lambda arr: arr[i], streams[:3]))
+    apply_i = lambda i: op[codes[i]](*take_i(i))
+    return list(map(apply_i, range(len(codes))))
+
+
+def columnar_kernel(cols):
+    assert not bad_records(*cols).size
+    return columnar_areas(*cols)
+
+
+def timed(func, *args):
+    t0 = time.perf_counter()
+    res = func(*args)
+    return time.perf_counter() - t0, res
+
+
+def main(argv):
+    max_exp = int(argv[1]) if len(argv) > 1 else 7
+    rng = np.random.default_rng(0)
+    # «NumPy, с» — проверка и расчёт по готовым массивам,
+    # «+списки, с» — вместе с переводом входных списков в массивы
+    print(f"{'фигур':>10} | {'лямбды, с':>10} | {'NumPy, с':>10} | {'+списки, с':>10} | ускорение")
+    for e in range(3, max_exp + 1):
+        size = 10 ** e
+        codes = rng.choice(list("STP"), size).tolist()
+        streams = [rng.uniform(0.1, 100.0, size).tolist() for _ in range(3)]
+
+        t_scalar, ref = timed(scalar_path, codes, streams)
+        t_conv, cols = timed(to_columns, codes, *streams)
+        t_col, res = timed(columnar_kernel, cols)
+        assert np.array_equal(np.asarray(ref, dtype=np.float64), res), "результаты расходятся"
+        print(f"{size:>10} | {t_scalar:>10.4f} | {t_col:>10.4f} | {t_conv + t_col:>10.4f} "
+              f"| x{t_scalar / t_col:.1f}")
+
+
+if __name__ == "__main__":
+    main(sys.argv)
@@ -0,0 +1,74 @@
+"""
+columnar.py — столбцовый (NumPy) расчёт площадей Задания 2 ЛР2.
+
+Коды разбиваются на маски S/T/P, площади считаются выражениями над
+массивами, а проверка pos (положительность и конечность) выполняется
+векторно и возвращает номера неверных записей. Формулы и порядок
+операций те же, что у лямбд S/T/P, поэтому результаты совпадают бит в бит.
+"""
+
+import numpy as np
+
+from areas import need_mask, areas_array
+
+
+def stop_index(codes) -> int:
+    """Позиция первого 'E' (или длина, если 'E' нет)."""
+    codes = np.asarray(codes)
+    hits = np.flatnonzero(codes == 'E')
+    return int(hits[0]) if hits.size else len(codes)
+
+
+def to_columns(codes, a, b, h, stop=None):
+    """Приводит потоки к массивам float64 длины stop (None -> nan)."""
+    codes = np.asarray(codes)
+    if stop is None:
+        stop = stop_index(codes)
+    cols = []
+    for arr in (a, b, h):
+        if len(arr) < stop:
+            raise ValueError("недостаточно числовых данных под операции до 'E'.")
+        cols.append(np.asarray(arr[:stop], dtype=np.float64))
+    return (codes[:stop], *cols)
+
+
+def unknown_codes(codes):
+    """Номера записей с кодом не из S/T/P."""
+    return np.flatnonzero(~np.isin(codes, list(need_mask)))
+
+
+def bad_records(codes, a, b, h):
+    """Номера записей, у которых нужные параметры не положительны или не конечны."""
+    bad = np.zeros(len(codes), dtype=bool)
+    for j, arr in enumerate((a, b, h)):
+        used = np.isin(codes, [c for c, mask in need_mask.items() if mask[j]])
+        bad |= used & ~(np.isfinite(arr) & (arr > 0))
+    return np.flatnonzero(bad)
+
+
+def columnar_areas(codes, a, b, h):
+    """Площади для уже проверенных столбцов (длины равны)."""
+    out = np.empty(len(codes), dtype=np.float64)
+    s = codes == 'S'
+    t = codes == 'T'
+    p = codes == 'P'
+    out[s] = a[s] * a[s]
+    out[t] = (a[t] + b[t]) * h[t] / 2.0
+    out[p] = a[p] * h[p]
+    return out
+
+
+def areas_from_list(L):
+    """
+    Полный путь для входа [[коды], [a...], [b...], [h...]]:
+    те же проверки, что в main.py, но номера неверных записей
+    перечисляются в ошибке.
+    """
+    if not (isinstance(L, list) and len(L) >= 4):
+        raise ValueError("Ошибка (Задание 2): ожидается [ [коды], [a...], [b...], [h...] ].")
+    codes = L[0]
+    stop = stop_index(codes)
+    try:
+        return areas_array(codes[:stop], *(arr[:stop] for arr in L[1:4]))
+    except ValueError as e:
+        raise ValueError(f"Ошибка (Задание 2): {e}") from None
@@ -0,0 +1,83 @@
+"""
+stream.py — потоковый режим Задания 2 ЛР2.
+
+Вместо списка [[коды],[a...],[b...],[h...]] записи читаются построчно,
+по одной фигуре на строку, и каждая площадь считается сразу:
+    S a           — квадрат
+    T a b h       — трапеция
+    P a h         — параллелограмм
+    E             — конец (остаток входа не читается)
+Чисел в записи ровно столько, сколько нужно фигуре: «столбцовая» запись
+КОД a b h (как i-й столбец списка L) для S и P не принимается — по
+строке «P 3 4 5» не понять, лишнее ли там число или пропущено другое.
+Разделители — пробелы или запятые, пустые строки и строки с # пропускаются.
+
+Запуск: python stream.py [файл]   (без файла — stdin)
+"""
+
+import sys
+
+from areas import area, need_mask
+
+err    = lambda msg: (_ for _ in ()).throw(ValueError(msg))
+ensure = lambda cond, msg: cond or err(msg)
+
+# где (a, b, h) стоят в компактной записи
+compact = { 'S': (0, None, None), 'T': (0, 1, 2), 'P': (0, None, 1) }
+
+to_number = lambda tok: int(tok) if tok.lstrip("+-").isdigit() else float(tok)
+
+
+def parse_record(line: str, lineno: int):
+    """Строка -> (код, (a, b, h)); None для пустых строк и комментариев."""
+    fields = line.replace(",", " ").split()
+    if not fields or fields[0].startswith("#"):
+        return None
+    code, nums = fields[0].upper(), fields[1:]
+    if code == 'E':
+        return code, (None, None, None)
+    ensure(code in need_mask,
+           f"Ошибка (Задание 2, строка {lineno}): неизвестный код фигуры {fields[0]!r} (допустимы: S, T, P, E).")
+    try:
+        nums = list(map(to_number, nums))
+    except ValueError:
+        err(f"Ошибка (Задание 2, строка {lineno}): параметры должны быть числами.")
+    need = sum(need_mask[code])
+    ensure(len(nums) >= need,
+           f"Ошибка (Задание 2, строка {lineno}): недостаточно числовых данных под операцию {code}.")
+    ensure(len(nums) == need,
+           f"Ошибка (Задание 2, строка {lineno}): лишние числа под операцию {code} (нужно {need}).")
+    return code, tuple(None if j is None else nums[j] for j in compact[code])
+
+
+def iter_records(lines):
+    """(номер строки, код, (a, b, h)) до первой записи E."""
+    for lineno, line in enumerate(lines, 1):
+        rec = parse_record(line, lineno)
+        if rec is None:
+            continue
+        if rec[0] == 'E':
+            return
+        yield (lineno, *rec)
+
+
+def stream_areas(lines):
+    """Проверяет и считает площади за один проход, храня одну запись за раз."""
+    for lineno, code, abh in iter_records(lines):
+        try:
+            yield area(code, *abh)
+        except ValueError as e:
+            err(f"Ошибка (Задание 2, строка {lineno}): {e}")
+
+
+def main(argv):
+    src = open(argv[1], "r", encoding="utf-8") if len(argv) > 1 else sys.stdin
+    try:
+        sys.stdout.writelines(map("{}\n".format, stream_areas(src)))
+    finally:
+        if src is not sys.stdin:
+            src.close()
+
+
+if __name__ == "__main__":
+    main(sys.argv)
@@ -0,0 +1,70 @@
+"""
+bench_query.py — запросы по нескольким полям: полный просмотр против
+движка query.py с упорядоченными индексами.
+
+Запуск: python bench_query.py [число преподавателей, по умолчанию 1000000]
+"""
+
+import random
+import sys
+import time
+from datetime import date, timedelta
+
+from main import Teacher
+from registry import TeacherRegistry
+from query import FIELDS, And, Contains, Eq, Or, Prefix, Range, explain, run
+from bench_search import WORDS, best_of
+
+SURNAMES = ["Иванов", "Петров", "Сидоров", "Смирнов", "Кузнецов", "Попов", "Васильев",
+            "Соколов", "Михайлов", "Новиков", "Фёдоров", "Морозов", "Волков", "Алексеев"]
+
+
+def linear_query(teachers, where, order_by=None, descending=False, limit=None):
+    rows = [t for t in teachers if where is None or where.matches(t)]
+    if order_by is not None:
+        value = FIELDS[order_by]
+        present = sorted((t for t in rows if value(t) is not None), key=value)
+        if descending:
+            present.reverse()
+        rows = present + [t for t in rows if value(t) is None]
+    return rows[:limit] if limit is not None else rows
+
+
+def main(argv):
+    size = int(argv[1]) if len(argv) > 1 else 1_000_000
+    rng = random.Random(0)
+    disciplines = [f"{rng.choice(WORDS)} {i}".capitalize() for i in range(2000)]
+    start = date(1950, 1, 1)
+    teachers = [Teacher(i, f"{rng.choice(SURNAMES)} {rng.randrange(10000)}", "МЖ"[i % 2],
+                        start + timedelta(days=rng.randrange(20000)), "",
+                        f"79{rng.randrange(10 ** 9):09d}", rng.choice(disciplines), rng.randrange(45))
+                for i in range(1, size + 1)]
+
+    registry = TeacherRegistry(teachers)
+    t0 = time.perf_counter()
+    for name in ("fio", "gender", "birth_date", "phone", "experience_years"):
+        registry.sorted_index(name, FIELDS[name])
+    print(f"преподавателей: {size}, построение индексов: {time.perf_counter() - t0:.2f} с")
+
+    queries = [
+        ("ФИО с «Иванов 12»", Prefix("fio", "Иванов 12"), None, None),
+        ("телефон +79123…", Prefix("phone", "79123"), None, None),
+        ("стаж 40..44 и Ж", And(Range("experience_years", 40, 44), Eq("gender", "Ж")), None, None),
+        ("родились в мае 1975", Range("birth_date", date(1975, 5, 1), date(1975, 5, 31)), "fio", None),
+        ("дисциплина или ФИО", Or(Contains("discipline", "оптика 1"), Prefix("fio", "Волков 99")), None, None),
+        ("Ж, стаж >= 5", And(Eq("gender", "Ж"), Range("experience_years", 5)), None, None),
+        ("все, по дате рождения", None, "birth_date", 100),
+        ("все, по ФИО убыв.", None, "fio", None),
+    ]
+    print(f"{'запрос':>24} | {'найдено':>8} | {'просмотр, мс':>12} | {'движок, мс':>10} | план")
+    for title, where, order_by, limit in queries:
+        descending = title.endswith("убыв.")
+        t_lin, expected = best_of(linear_query, teachers, where, order_by, descending, limit, repeat=1)
+        t_idx, found = best_of(run, registry, where, order_by, descending, limit, repeat=3)
+        assert found == expected
+        print(f"{title:>24} | {len(found):>8} | {t_lin * 1e3:>12.1f} | {t_idx * 1e3:>10.2f} | "
+              f"{explain(registry, where)}")
+
+
+if __name__ == "__main__":
+    main(sys.argv)
@@ -0,0 +1,53 @@
+"""
+bench_search.py — поиск по дисциплине: линейный просмотр против индекса.
+
+Запуск: python bench_search.py [число преподавателей, по умолчанию 1000000]
+"""
+
+import random
+import sys
+import time
+
+from main import Teacher
+from registry import TeacherRegistry
+
+WORDS = ["математика", "физика", "информатика", "химия", "литература", "история",
+         "биология", "экономика", "право", "философия", "механика", "оптика",
+         "алгебра", "геометрия", "статистика", "логика", "анализ", "программирование"]
+
+
+def linear_search(teachers, query):
+    q = query.strip().lower()
+    return [t for t in teachers if q in (t.discipline or '').lower()]
+
+
+def best_of(func, *args, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        res = func(*args)
+        best = min(best, time.perf_counter() - t0)
+    return best, res
+
+
+def main(argv):
+    size = int(argv[1]) if len(argv) > 1 else 1_000_000
+    rng = random.Random(0)
+    # ~5000 различных дисциплин вида «оптика и механика 17»
+    disciplines = [f"{rng.choice(WORDS)} и {rng.choice(WORDS)} {i}".capitalize() for i in range(5000)]
+    teachers = [Teacher(i, f"Преподаватель {i}", discipline=rng.choice(disciplines))
+                for i in range(1, size + 1)]
+
+    t0 = time.perf_counter()
+    registry = TeacherRegistry(teachers)
+    print(f"преподавателей: {size}, построение реестра с индексом: {time.perf_counter() - t0:.2f} с")
+    print(f"{'запрос':>22} | {'найдено':>8} | {'просмотр, мс':>12} | {'индекс, мс':>10}")
+    for query in ("механика 17", "и оптика 42", "4999", "логика", "Ка", "нет такой"):
+        t_lin, expected = best_of(linear_search, teachers, query, repeat=2)
+        t_idx, found = best_of(registry.search_discipline, query)
+        assert found == expected
+        print(f"{query:>22} | {len(found):>8} | {t_lin * 1e3:>12.1f} | {t_idx * 1e3:>10.2f}")
+
+
+if __name__ == "__main__":
+    main(sys.argv)
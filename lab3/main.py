@@ -1,7 +1,10 @@
 from __future__ import annotations
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
-from typing import List, Optional
+from typing import Optional
+
+from registry import TeacherRegistry
+import query
 
 
 def parse_int(value: str, name: str, min_value: Optional[int] = None) -> int:
@@ -54,7 +57,8 @@ def nonempty(value: str, name: str) -> str:
 
 # ------------------------------ МОДЕЛЬ ДАННЫХ --------------------------------
 
-@dataclass
+# slots=True: у объектов нет __dict__, на больших реестрах это основная экономия памяти
+@dataclass(slots=True)
 class Teacher:
     tab_number: int = field(default=0)                 # табельный номер
     fio: str = field(default="")                       # ФИО
@@ -147,7 +151,7 @@ def print_header(title: str):
     print("=" * 80)
 
 
-def list_teachers(teachers: List[Teacher]):
+def list_teachers(teachers: TeacherRegistry):
     if not teachers:
         print("Список пуст.")
         return
@@ -158,7 +162,7 @@ def list_teachers(teachers: List[Teacher]):
         print(f"{idx:>2}. {t.short()}")
 
 
-def show_all_full(teachers: List[Teacher]):
+def show_all_full(teachers: TeacherRegistry):
     if not teachers:
         print("Список пуст.")
         return
@@ -169,25 +173,25 @@ def show_all_full(teachers: List[Teacher]):
         print("-" * 80)
 
 
-def delete_teacher(teachers: List[Teacher]):
+def delete_teacher(teachers: TeacherRegistry):
     if not teachers:
         print("Список пуст — удалять нечего.")
         return
     list_teachers(teachers)
     idx = ask(lambda v: parse_int(v, "Номер в списке", 1), "Введите № для удаления: ")
     if 1 <= idx <= len(teachers):
-        removed = teachers.pop(idx - 1)
+        removed = teachers.remove_at(idx - 1)
         print(f"Удалён: {removed.short()}")
     else:
         print("Нет элемента с таким номером.")
 
 
-def search_by_discipline(teachers: List[Teacher]):
+def search_by_discipline(teachers: TeacherRegistry):
     query = input("Введите название дисциплины (или её часть): ").strip().lower()
     if not query:
         print("Поисковый запрос пуст.")
         return
-    results = [t for t in teachers if query in (t.discipline or '').lower()]
+    results = teachers.search_discipline(query)
     if not results:
         print("Ничего не найдено.")
         return
@@ -196,17 +200,67 @@ def search_by_discipline(teachers: List[Teacher]):
         print(t.short())
 
 
+def ask_sort_field(prompt: str):
+    def parse(v):
+        if v not in query.FIELDS:
+            raise ValueError(f"поле должно быть одним из: {', '.join(query.FIELDS)}.")
+        return v
+    return ask_optional(parse, prompt)
+
+
+def advanced_search(teachers: TeacherRegistry):
+    print("Условия (оставьте поле пустым, чтобы не учитывать его):")
+    gender = ask_optional(normalize_gender, "Пол (М/Ж): ")
+    born_from = ask_optional(lambda v: parse_date(v, "Дата рождения"), "Дата рождения от: ")
+    born_to = ask_optional(lambda v: parse_date(v, "Дата рождения"), "Дата рождения до: ")
+    exp_from = ask_optional(lambda v: parse_int(v, "Стаж", 0), "Стаж от (лет): ")
+    exp_to = ask_optional(lambda v: parse_int(v, "Стаж", 0), "Стаж до (лет): ")
+    phone = input("Телефон начинается с: ").strip()
+    fio = input("ФИО начинается с: ").strip()
+    discipline = input("Дисциплина содержит: ").strip()
+
+    conditions = []
+    if gender:
+        conditions.append(query.Eq("gender", gender))
+    if born_from or born_to:
+        conditions.append(query.Range("birth_date", born_from, born_to))
+    if exp_from is not None or exp_to is not None:
+        conditions.append(query.Range("experience_years", exp_from, exp_to))
+    if phone:
+        conditions.append(query.Prefix("phone", phone))
+    if fio:
+        conditions.append(query.Prefix("fio", fio))
+    if discipline:
+        conditions.append(query.Contains("discipline", discipline))
+
+    where = None
+    if len(conditions) == 1:
+        where = conditions[0]
+    elif conditions:
+        mode = input("Объединить условия: И / ИЛИ (по умолчанию И): ").strip().lower()
+        where = query.Or(*conditions) if mode in ("или", "or") else query.And(*conditions)
+    order_by = ask_sort_field(f"Сортировать по ({', '.join(query.FIELDS)}; пусто — порядок списка): ")
+    descending = bool(order_by) and input("По убыванию? (д/н): ").strip().lower() in ("д", "да", "y")
+
+    results = query.run(teachers, where, order_by, descending)
+    if not results:
+        print("Ничего не найдено.")
+        return
+    print_header(f"Найдено преподавателей: {len(results)} ({query.explain(teachers, where)})")
+    for t in results:
+        print(t.short())
+
 
-def add_teacher(teachers: List[Teacher]):
+def add_teacher(teachers: TeacherRegistry):
     new_teacher = Teacher.from_input()
-    if any(t.tab_number == new_teacher.tab_number for t in teachers):
+    if new_teacher.tab_number in teachers:
         print(f"Ошибка: преподаватель с табельным номером {new_teacher.tab_number} уже существует.")
         return
-    teachers.append(new_teacher)
+    teachers.add(new_teacher)
     print("Преподаватель добавлен.")
 
 def main():
-    teachers: List[Teacher] = []
+    teachers = TeacherRegistry()
 
     actions = {
         "1": ("Добавить преподавателя", lambda: add_teacher(teachers)),
@@ -214,6 +268,7 @@ def main():
         "3": ("Показать всех (кратко)", lambda: list_teachers(teachers)),
         "4": ("Показать всех (полно)", lambda: show_all_full(teachers)),
         "5": ("Поиск по дисциплине", lambda: search_by_discipline(teachers)),
+        "6": ("Поиск по нескольким полям", lambda: advanced_search(teachers)),
         "0": ("Выход", None),
     }
 
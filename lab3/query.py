@@ -0,0 +1,281 @@
+"""
+query.py — запросы по нескольким полям преподавателя с сортировкой.
+
+Условия собираются из простых частей и комбинируются через And/Or:
+    Eq("gender", "Ж")                        — равенство
+    Range("experience_years", 10, 20)        — диапазон (границы включительно, None — без границы)
+    Range("birth_date", high=date(1980, 1, 1))
+    Prefix("fio", "иван"), Prefix("phone", "+7999")
+    Contains("discipline", "физ")            — подстрока
+    And(...), Or(...)
+
+run(registry, where, order_by, descending, limit) выбирает индекс вместо
+полного просмотра: для Eq/Range/Prefix — упорядоченный индекс реестра
+(SortedIndex, bisect), для подстроки в дисциплине — триграммный индекс.
+В And берётся условие с наименьшим числом кандидатов, остальные
+проверяются только на них; Or объединяет кандидатов, если индекс есть
+у каждой ветки. Текстовые поля сравниваются без учёта регистра.
+
+Те же условия переводятся в SQL (to_sql) для ЛР7.
+"""
+
+from __future__ import annotations
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from registry import TeacherRegistry
+
+TEXT_FIELDS = ("fio", "address", "discipline")
+STRING_FIELDS = TEXT_FIELDS + ("gender", "phone")
+
+
+def _field(name: str) -> Callable:
+    if name in TEXT_FIELDS:
+        return lambda t: (getattr(t, name) or "").casefold()
+    if name in ("gender", "phone"):
+        # пустые пол и телефон — «не указано», как None у даты
+        return lambda t: getattr(t, name) or None
+    return lambda t: getattr(t, name)
+
+
+FIELDS: Dict[str, Callable] = {name: _field(name) for name in (
+    "tab_number", "fio", "gender", "birth_date", "address", "phone", "discipline", "experience_years")}
+# поля с упорядоченным индексом (строится в реестре при первом запросе)
+SORTED_FIELDS = ("tab_number", "fio", "gender", "birth_date", "phone", "experience_years")
+# полный просмотр дешевле, если кандидатов больше этой доли реестра
+SCAN_RATIO = 0.5
+
+_MAX_CHAR = "\U0010ffff"
+
+
+def _check_field(name: str) -> Callable:
+    if name not in FIELDS:
+        raise ValueError(f"неизвестное поле {name!r}.")
+    return FIELDS[name]
+
+
+def _check_string(name: str) -> Callable:
+    if name not in STRING_FIELDS:
+        raise ValueError(f"поле {name!r} не строковое.")
+    return FIELDS[name]
+
+
+def _norm(name: str, value):
+    return value.casefold() if name in TEXT_FIELDS and isinstance(value, str) else value
+
+
+def _like_escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+# ------------------------------ условия --------------------------------------
+
+class Eq:
+    def __init__(self, name: str, value):
+        self.value_of = _check_field(name)
+        self.name, self.value = name, _norm(name, value)
+
+    def matches(self, t) -> bool:
+        return self.value_of(t) == self.value
+
+    def span(self) -> Tuple:
+        return self.value, self.value, True
+
+    def to_sql(self, columns: Dict[str, str]) -> Tuple[str, list]:
+        col = _column(columns, self.name)
+        return f"{col} = %s", [self.value]
+
+
+class Range:
+    def __init__(self, name: str, low=None, high=None):
+        self.value_of = _check_field(name)
+        self.name, self.low, self.high = name, _norm(name, low), _norm(name, high)
+
+    def matches(self, t) -> bool:
+        v = self.value_of(t)
+        return (v is not None and (self.low is None or v >= self.low)
+                and (self.high is None or v <= self.high))
+
+    def span(self) -> Tuple:
+        return self.low, self.high, True
+
+    def to_sql(self, columns: Dict[str, str]) -> Tuple[str, list]:
+        col = _column(columns, self.name)
+        parts, params = [f"{col} IS NOT NULL"], []
+        if self.low is not None:
+            parts.append(f"{col} >= %s")
+            params.append(self.low)
+        if self.high is not None:
+            parts.append(f"{col} <= %s")
+            params.append(self.high)
+        return " AND ".join(parts), params
+
+
+class Prefix:
+    def __init__(self, name: str, prefix: str):
+        self.value_of = _check_string(name)
+        self.name, self.prefix = name, _norm(name, prefix)
+
+    def matches(self, t) -> bool:
+        v = self.value_of(t)
+        return v is not None and v.startswith(self.prefix)
+
+    def span(self) -> Tuple:
+        # все строки с префиксом p лежат в [p, p + максимальный символ)
+        return self.prefix, self.prefix + _MAX_CHAR, False
+
+    def to_sql(self, columns: Dict[str, str]) -> Tuple[str, list]:
+        col = _column(columns, self.name)
+        return f"{col} LIKE %s", [_like_escape(self.prefix) + "%"]
+
+
+class Contains:
+    def __init__(self, name: str, text: str):
+        self.value_of = _check_string(name)
+        self.name, self.text = name, _norm(name, text)
+
+    def matches(self, t) -> bool:
+        v = self.value_of(t)
+        return v is not None and self.text in v
+
+    def to_sql(self, columns: Dict[str, str]) -> Tuple[str, list]:
+        col = _column(columns, self.name)
+        return f"{col} LIKE %s", ["%" + _like_escape(self.text) + "%"]
+
+
+class And:
+    def __init__(self, *parts):
+        self.parts = parts
+
+    def matches(self, t) -> bool:
+        return all(p.matches(t) for p in self.parts)
+
+    def to_sql(self, columns: Dict[str, str]) -> Tuple[str, list]:
+        return _join(self.parts, " AND ", columns, "TRUE")
+
+
+class Or:
+    def __init__(self, *parts):
+        self.parts = parts
+
+    def matches(self, t) -> bool:
+        return any(p.matches(t) for p in self.parts)
+
+    def to_sql(self, columns: Dict[str, str]) -> Tuple[str, list]:
+        return _join(self.parts, " OR ", columns, "FALSE")
+
+
+def _column(columns: Dict[str, str], name: str) -> str:
+    # в SQL попадают только имена колонок из белого списка, значения — параметрами
+    if name not in columns:
+        raise ValueError(f"поле {name!r} нельзя использовать в запросе.")
+    col = columns[name]
+    return f"lower({col})" if name in TEXT_FIELDS else col
+
+
+def _join(parts, op: str, columns: Dict[str, str], empty: str) -> Tuple[str, list]:
+    if not parts:
+        return empty, []
+    sqls, params = [], []
+    for p in parts:
+        sql, ps = p.to_sql(columns)
+        sqls.append(f"({sql})")
+        params += ps
+    return op.join(sqls), params
+
+
+# ------------------------------ выполнение -----------------------------------
+
+class _Plan:
+    """Кандидаты одного условия: оценка их числа и способ получить ячейки."""
+
+    def __init__(self, cost: int, fetch: Callable[[], Set[int]], text: str):
+        self.cost, self.fetch, self.text = cost, fetch, text
+
+
+def _plan(registry: TeacherRegistry, cond) -> Optional[_Plan]:
+    """План по индексу или None, если без полного просмотра не обойтись."""
+    if isinstance(cond, (Eq, Range, Prefix)) and cond.name in SORTED_FIELDS:
+        index = registry.sorted_index(cond.name, cond.value_of)
+        i, j = index.span(*cond.span())
+        return _Plan(j - i, lambda: set(index.keys[i:j]), f"индекс {cond.name}: {j - i}")
+    if isinstance(cond, Contains) and cond.name == "discipline" and cond.text:
+        # пустые дисциплины в индекс не попадают — пустой запрос только просмотром
+        found = registry.discipline_slots(cond.text)
+        return _Plan(len(found), lambda: found, f"индекс discipline: {len(found)}")
+    if isinstance(cond, And):
+        plans = [p for p in (_plan(registry, c) for c in cond.parts) if p is not None]
+        return min(plans, key=lambda p: p.cost) if plans else None
+    if isinstance(cond, Or) and cond.parts:
+        plans = [_plan(registry, c) for c in cond.parts]
+        if any(p is None for p in plans):
+            return None
+
+        def fetch():
+            return set().union(*(p.fetch() for p in plans))
+        return _Plan(sum(p.cost for p in plans), fetch, " ИЛИ ".join(p.text for p in plans))
+    return None
+
+
+def explain(registry: TeacherRegistry, where=None) -> str:
+    plan = None if where is None else _plan(registry, where)
+    if plan is None or plan.cost > SCAN_RATIO * len(registry):
+        return f"полный просмотр: {len(registry)}"
+    return plan.text
+
+
+def _order(registry: TeacherRegistry, slots: List[int], field: str, descending: bool,
+           limit: Optional[int]) -> List[int]:
+    """
+    slots (по возрастанию) в порядке field: по возрастанию значения, при
+    равенстве — в порядке списка; descending — ровно обратный порядок.
+    Записи без значения (None) в обоих случаях идут в конце.
+    """
+    value_of = _check_field(field)
+    if field in SORTED_FIELDS and len(slots) > len(registry) // 8:
+        # большой результат: пройти готовый индекс дешевле, чем сортировать
+        index = registry.sorted_index(field, value_of)
+        wanted = set(slots)
+        ordered = []
+        for s in (reversed(index.keys) if descending else index.keys):
+            if s in wanted:
+                ordered.append(s)
+                if len(ordered) == limit:
+                    return ordered
+        if len(ordered) < len(slots):
+            at = registry.at_slot
+            ordered += [s for s in slots if value_of(at(s)) is None]
+        return ordered
+    at = registry.at_slot
+    rows = [(s, value_of(at(s))) for s in slots]
+    present = [r for r in rows if r[1] is not None]
+    present.sort(key=lambda r: r[1])  # устойчивая: равные остаются в порядке списка
+    if descending:
+        present.reverse()
+    return [s for s, _ in present] + [s for s, v in rows if v is None]
+
+
+def run(registry: TeacherRegistry, where=None, order_by: Optional[str] = None,
+        descending: bool = False, limit: Optional[int] = None) -> List:
+    """Преподаватели, удовлетворяющие where, в порядке order_by (по умолчанию — порядок списка)."""
+    plan = None if where is None else _plan(registry, where)
+    if plan is None or plan.cost > SCAN_RATIO * len(registry):
+        candidates = registry.slots()
+    else:
+        candidates = sorted(plan.fetch())
+    if where is None:
+        slots = list(candidates)
+    else:
+        at = registry.at_slot
+        slots = [s for s in candidates if where.matches(at(s))]
+    if order_by is not None:
+        slots = _order(registry, slots, order_by, descending, limit)
+    if limit is not None:
+        slots = slots[:limit]
+    return registry.at_slots(slots)
+
+
+def to_sql(where=None, columns: Optional[Dict[str, str]] = None) -> Tuple[str, list]:
+    """Условие WHERE и параметры для psycopg2; columns — белый список «поле -> колонка»."""
+    if where is None:
+        return "TRUE", []
+    return where.to_sql(columns or {})
@@ -0,0 +1,143 @@
+from __future__ import annotations
+import os
+import sys
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from search_index import DisciplineIndex, SortedIndex
+
+# дерево Фенвика по ячейкам — общее с ЛР1 (typed_list.Positions)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "lab1"))
+from typed_list import Positions
+
+
+class TeacherRegistry:
+    """
+    Реестр преподавателей: порядок добавления для нумерованного списка
+    и хеш-индекс по табельному номеру.
+    Проверка дубликата и поиск по номеру — O(1), удаление по номеру
+    в списке — O(log n) без сдвига элементов. Дисциплины попадают
+    в DisciplineIndex, поиск по подстроке не перебирает весь реестр.
+    Упорядоченные индексы по полям (SortedIndex) строятся при первом
+    запросе sorted_index() и дальше обновляются вместе с реестром.
+    """
+
+    def __init__(self, teachers: Iterable = ()):
+        self._items: Dict[int, object] = {}    # ячейка -> преподаватель, по порядку
+        self._by_tab: Dict[int, int] = {}      # табельный номер -> ячейка
+        self._pos = Positions()
+        self._disciplines = DisciplineIndex()  # ключи — ячейки
+        self._sorted: Dict[str, Tuple[Callable, SortedIndex]] = {}  # поле -> (значение, индекс)
+        self.extend(teachers)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator:
+        return iter(self._items.values())
+
+    def __contains__(self, tab_number: int) -> bool:
+        return tab_number in self._by_tab
+
+    def __getitem__(self, index: int):
+        """Преподаватель по позиции в списке (с 0)."""
+        if index < 0:
+            index += len(self._items)
+        if not 0 <= index < len(self._items):
+            raise IndexError("Нет элемента с таким номером.")
+        return self._items[self._pos.find(index)]
+
+    def get(self, tab_number: int) -> Optional[object]:
+        slot = self._by_tab.get(tab_number)
+        return None if slot is None else self._items[slot]
+
+    def position(self, tab_number: int) -> Optional[int]:
+        """Позиция (с 0) преподавателя с таким табельным номером."""
+        slot = self._by_tab.get(tab_number)
+        return None if slot is None else self._pos.rank(slot)
+
+    def add(self, teacher) -> None:
+        if teacher.tab_number in self._by_tab:
+            raise ValueError(f"преподаватель с табельным номером {teacher.tab_number} уже существует.")
+        slot = len(self._pos)
+        self._pos.append()
+        self._items[slot] = teacher
+        self._by_tab[teacher.tab_number] = slot
+        self._disciplines.add(slot, teacher.discipline)
+        for value, index in self._sorted.values():
+            index.add(slot, value(teacher))
+
+    append = add
+
+    def extend(self, teachers: Iterable) -> None:
+        for t in teachers:
+            self.add(t)
+
+    def remove_at(self, index: int):
+        """Удаляет преподавателя по позиции в списке (с 0) и возвращает его."""
+        teacher = self[index]
+        slot = self._by_tab.pop(teacher.tab_number)
+        del self._items[slot]
+        self._pos.clear(slot)
+        self._disciplines.remove(slot, teacher.discipline)
+        for value, index in self._sorted.values():
+            index.remove(slot, value(teacher))
+        return teacher
+
+    def replace_at(self, index: int, teacher) -> None:
+        """Заменяет преподавателя на позиции index (с 0), не меняя порядок."""
+        old = self[index]
+        slot = self._by_tab[old.tab_number]
+        if teacher.tab_number != old.tab_number:
+            if teacher.tab_number in self._by_tab:
+                raise ValueError(f"табельный номер {teacher.tab_number} уже используется.")
+            del self._by_tab[old.tab_number]
+            self._by_tab[teacher.tab_number] = slot
+        self._disciplines.remove(slot, old.discipline)
+        self._disciplines.add(slot, teacher.discipline)
+        for value, index in self._sorted.values():
+            index.remove(slot, value(old))
+            index.add(slot, value(teacher))
+        self._items[slot] = teacher
+
+    # позволяет работать с реестром как со списком: teachers[i] = t, del teachers[i]
+    __setitem__ = replace_at
+
+    def __delitem__(self, index: int) -> None:
+        self.remove_at(index)
+
+    def clear(self) -> None:
+        self._items.clear()
+        self._by_tab.clear()
+        self._pos = Positions()
+        self._disciplines.clear()
+        self._sorted.clear()
+
+    def search_discipline(self, query: str) -> List:
+        """Преподаватели (в порядке списка), у которых дисциплина содержит query."""
+        items = self._items
+        return [items[slot] for slot in sorted(self._disciplines.search(query))]
+
+    # ------------------- для движка запросов (query.py) ----------------------
+    # записи адресуются ячейками: ячейки растут в порядке добавления,
+    # так что сортировка ячеек даёт порядок списка
+
+    def sorted_index(self, name: str, value: Callable) -> SortedIndex:
+        """Упорядоченный индекс по value(teacher); строится один раз на поле name."""
+        entry = self._sorted.get(name)
+        if entry is None:
+            index = SortedIndex((value(t), slot) for slot, t in self._items.items())
+            self._sorted[name] = entry = (value, index)
+        return entry[1]
+
+    def slots(self) -> Iterable[int]:
+        return self._items.keys()
+
+    def at_slots(self, slots: Iterable[int]) -> List:
+        items = self._items
+        return [items[s] for s in slots]
+
+    def at_slot(self, slot: int):
+        return self._items[slot]
+
+    def discipline_slots(self, query: str) -> Set[int]:
+        return self._disciplines.search(query)
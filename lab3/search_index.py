@@ -0,0 +1,138 @@
+from __future__ import annotations
+from bisect import bisect_left, bisect_right
+from typing import Dict, Hashable, Iterable, Set, Tuple
+
+
+def normalize(value: str) -> str:
+    return (value or "").casefold()
+
+
+def trigrams(value: str) -> Set[str]:
+    return {value[i:i + 3] for i in range(len(value) - 2)}
+
+
+class DisciplineIndex:
+    """
+    Инвертированный индекс «дисциплина -> ключи записей».
+
+    Дисциплины сравниваются без учёта регистра (casefold). Для поиска
+    по подстроке различные дисциплины разложены на триграммы: запрос
+    от 3 символов проверяется только на дисциплинах, содержащих все
+    его триграммы; короткие запросы проверяются по списку различных
+    дисциплин (их обычно на порядки меньше, чем записей).
+    Индекс обновляется при каждом add/remove.
+    """
+
+    def __init__(self):
+        self._keys: Dict[str, Dict[Hashable, None]] = {}  # дисциплина -> ключи (упорядоченное множество)
+        self._grams: Dict[str, Set[str]] = {}             # триграмма -> дисциплины
+
+    def add(self, key: Hashable, discipline: str) -> None:
+        d = normalize(discipline)
+        if not d:
+            return
+        keys = self._keys.get(d)
+        if keys is None:
+            self._keys[d] = keys = {}
+            for g in trigrams(d):
+                self._grams.setdefault(g, set()).add(d)
+        keys[key] = None
+
+    def remove(self, key: Hashable, discipline: str) -> None:
+        d = normalize(discipline)
+        keys = self._keys.get(d)
+        if keys is None:
+            return
+        keys.pop(key, None)
+        if not keys:
+            del self._keys[d]
+            for g in trigrams(d):
+                bucket = self._grams[g]
+                bucket.discard(d)
+                if not bucket:
+                    del self._grams[g]
+
+    def clear(self) -> None:
+        self._keys.clear()
+        self._grams.clear()
+
+    def disciplines(self, query: str) -> Iterable[str]:
+        """Различные дисциплины, содержащие query."""
+        q = normalize(query)
+        if len(q) < 3:
+            return [d for d in self._keys if q in d]
+        buckets = []
+        for g in trigrams(q):
+            bucket = self._grams.get(g)
+            if not bucket:
+                return []
+            buckets.append(bucket)
+        buckets.sort(key=len)
+        candidates = set(buckets[0]).intersection(*buckets[1:])
+        return [d for d in candidates if q in d]
+
+    def search(self, query: str) -> Set[Hashable]:
+        """Ключи записей, у которых дисциплина содержит query."""
+        found: Set[Hashable] = set()
+        for d in self.disciplines(query):
+            found.update(self._keys[d])
+        return found
+
+    def exact(self, discipline: str) -> Iterable[Hashable]:
+        return self._keys.get(normalize(discipline), {}).keys()
+
+
+class SortedIndex:
+    """
+    Упорядоченный индекс «значение -> ключи записей» для запросов по
+    диапазону и префиксу. Хранится двумя параллельными списками,
+    отсортированными по (значение, ключ); поиск — bisect, вставка
+    и удаление — O(log n) на поиск места плюс сдвиг списка.
+    Записи со значением None в индекс не попадают.
+    """
+
+    def __init__(self, pairs: Iterable = ()):
+        """pairs — (значение, ключ) с ключами по возрастанию."""
+        values, keys = [], []
+        for v, k in pairs:
+            if v is not None:
+                values.append(v)
+                keys.append(k)
+        # сортировка устойчивая: при равных значениях ключи остаются по возрастанию,
+        # а сравнивать только значения быстрее, чем кортежи (значение, ключ)
+        order = sorted(range(len(values)), key=values.__getitem__)
+        self.values = [values[i] for i in order]
+        self.keys = [keys[i] for i in order]
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def _find(self, value, key) -> int:
+        lo = bisect_left(self.values, value)
+        hi = bisect_right(self.values, value, lo)
+        return bisect_left(self.keys, key, lo, hi)
+
+    def add(self, key, value) -> None:
+        if value is None:
+            return
+        i = self._find(value, key)
+        self.values.insert(i, value)
+        self.keys.insert(i, key)
+
+    def remove(self, key, value) -> None:
+        if value is None:
+            return
+        i = self._find(value, key)
+        del self.values[i]
+        del self.keys[i]
+
+    def span(self, low=None, high=None, high_inclusive: bool = True) -> Tuple[int, int]:
+        """Границы [i, j) записей с low <= значение <= high (или < high)."""
+        i = 0 if low is None else bisect_left(self.values, low)
+        if high is None:
+            j = len(self.values)
+        elif high_inclusive:
+            j = bisect_right(self.values, high, i)
+        else:
+            j = bisect_left(self.values, high, i)
+        return i, max(i, j)
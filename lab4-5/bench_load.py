@@ -0,0 +1,89 @@
+"""
+bench_load.py — скорость разбора записей Teacher.from_dict (записей/с):
+прежние парсеры (strptime, словарь пола на каждый вызов, два прохода
+по телефону) против текущих, и режим trusted для файлов самого приложения.
+
+Запуск: python bench_load.py [число записей, по умолчанию 200000]
+"""
+
+import sys
+import time
+from datetime import date, datetime
+
+from model import Teacher
+from controller import parse_int
+
+
+def legacy_parse_date(value, name="Дата"):
+    if not value:
+        return None
+    for fmt in ("%d.%m.%Y", "%Y-%m-%d"):
+        try:
+            return datetime.strptime(value, fmt).date()
+        except ValueError:
+            pass
+    raise ValueError(f"{name}: неверный формат.")
+
+
+def legacy_normalize_gender(value):
+    v = (value or "").strip().lower()
+    mapping = {"м": "М", "муж": "М", "мужской": "М", "m": "М",
+               "ж": "Ж", "жен": "Ж", "женский": "Ж", "f": "Ж"}
+    if v in mapping:
+        return mapping[v]
+    raise ValueError("Пол: укажите М/Ж.")
+
+
+def legacy_normalize_phone(value):
+    if not value:
+        return ""
+    allowed = "".join(ch for ch in value if ch.isdigit() or ch == "+")
+    digits = "".join(ch for ch in allowed if ch.isdigit())
+    if not (10 <= len(digits) <= 15):
+        raise ValueError("Телефон: неверный номер.")
+    return "+" + digits if allowed.startswith("+") else digits
+
+
+class LegacyTeacher(Teacher):
+    __slots__ = ()
+
+    def __post_init__(self):
+        if isinstance(self.tab_number, str):
+            self.tab_number = parse_int(self.tab_number, "Табельный номер", 1)
+        if isinstance(self.experience_years, str):
+            self.experience_years = parse_int(self.experience_years, "Стаж (лет)", 0)
+        if isinstance(self.birth_date, str):
+            self.birth_date = legacy_parse_date(self.birth_date, "Дата рождения")
+        if self.gender:
+            self.gender = legacy_normalize_gender(self.gender)
+        if self.phone:
+            self.phone = legacy_normalize_phone(self.phone)
+
+
+def make_records(count):
+    # так записи выглядят после save_teachers
+    return [Teacher(i, f"Фамилия{i} Имя Отчество", "МЖ"[i % 2],
+                    date(1950 + i % 50, 1 + i % 12, 1 + i % 28), "г. Орёл",
+                    f"7980{i:07d}", "Физика", i % 40).to_dict()
+            for i in range(1, count + 1)]
+
+
+def rate(build, records):
+    t0 = time.perf_counter()
+    for item in records:
+        build(item)
+    return len(records) / (time.perf_counter() - t0)
+
+
+def main(argv):
+    count = int(argv[1]) if len(argv) > 1 else 200_000
+    records = make_records(count)
+    print(f"записей: {count}")
+    for name, build in (("до (strptime и пр.)", LegacyTeacher.from_dict),
+                        ("после, проверка", Teacher.from_dict),
+                        ("после, trusted", lambda d: Teacher.from_dict(d, trusted=True))):
+        print(f"{name:>20}: {rate(build, records):>10,.0f} записей/с")
+
+
+if __name__ == "__main__":
+    main(sys.argv)
@@ -0,0 +1,60 @@
+"""
+bench_memory.py — память на одного преподавателя: Teacher (slots) против
+такого же dataclass с __dict__ (как было до slots=True).
+
+Запуск: python bench_memory.py [число записей, по умолчанию 200000]
+"""
+
+import sys
+import tracemalloc
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Optional
+
+from model import Teacher
+
+
+@dataclass
+class DictTeacher:
+    tab_number: int = field(default=0)
+    fio: str = field(default="")
+    gender: str = field(default="")
+    birth_date: Optional[date] = field(default=None)
+    address: str = field(default="")
+    phone: str = field(default="")
+    discipline: str = field(default="")
+    experience_years: int = field(default=0)
+
+
+def make_rows(count):
+    disciplines = ["Математика", "Физика", "Информатика", "Химия", "Литература"]
+    return [(i, f"Фамилия{i} Имя Отчество", "М" if i % 2 else "Ж",
+             date(1950 + i % 50, 1 + i % 12, 1 + i % 28), f"г. Орёл, ул. Ленина {i % 300}",
+             "", disciplines[i % 5], i % 40)
+            for i in range(1, count + 1)]
+
+
+def bytes_per_object(cls, rows):
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    objs = [cls(*row) for row in rows]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    grown = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    # список objs — 8 байт на ссылку, вычитаем
+    return (grown - sys.getsizeof(objs)) / len(objs), sys.getsizeof(objs[0])
+
+
+def main(argv):
+    count = int(argv[1]) if len(argv) > 1 else 200_000
+    # строки и даты общие, телефон пуст (normalize_phone создал бы новую строку):
+    # считается только сам объект
+    rows = make_rows(count)
+    print(f"записей: {count}")
+    for name, cls in (("dataclass (__dict__)", DictTeacher), ("Teacher (slots)", Teacher)):
+        per_obj, shallow = bytes_per_object(cls, rows)
+        print(f"{name:>22}: {per_obj:7.1f} байт/преподаватель (getsizeof объекта: {shallow})")
+
+
+if __name__ == "__main__":
+    main(sys.argv)
@@ -0,0 +1,50 @@
+"""
+bench_snapshot.py — открытие списка преподавателей: JSON (разбор всех
+записей) против двоичного снимка .tsnap (mmap, строки по запросу).
+
+Запуск: python bench_snapshot.py [число записей, по умолчанию 200000]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from bench_load import make_records
+from model import Teacher, iter_teachers, save_teachers
+from snapshot import Snapshot, json_to_snapshot, snapshot_to_json
+
+
+def main(argv):
+    count = int(argv[1]) if len(argv) > 1 else 200_000
+    teachers = [Teacher.from_dict(d, trusted=True) for d in make_records(count)]
+    with tempfile.TemporaryDirectory() as tmp:
+        src = os.path.join(tmp, "teachers.json")
+        snap_path = os.path.join(tmp, "teachers.tsnap")
+        back = os.path.join(tmp, "back.json")
+        save_teachers(src, teachers)
+        t0 = time.perf_counter()
+        json_to_snapshot(src, snap_path)
+        print(f"записей: {count}, JSON -> .tsnap: {time.perf_counter() - t0:.2f} с")
+        print(f"размер: JSON {os.path.getsize(src) / 2**20:.1f} МиБ, .tsnap {os.path.getsize(snap_path) / 2**20:.1f} МиБ")
+
+        t0 = time.perf_counter()
+        loaded = list(iter_teachers(src))
+        print(f"открыть JSON: {time.perf_counter() - t0:.3f} с")
+
+        t0 = time.perf_counter()
+        with Snapshot(snap_path) as snap:
+            opened = time.perf_counter() - t0
+            row = snap[count // 2]
+            first_row = time.perf_counter() - t0
+            assert row == loaded[count // 2]
+        print(f"открыть .tsnap: {opened * 1e3:.3f} мс, до первой строки: {first_row * 1e3:.3f} мс")
+
+        snapshot_to_json(snap_path, back)
+        with open(src, encoding="utf-8") as a, open(back, encoding="utf-8") as b:
+            assert a.read() == b.read()
+        print(".tsnap -> JSON: файл совпадает с исходным")
+
+
+if __name__ == "__main__":
+    main(sys.argv)
@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import date, datetime
 from typing import Optional
 
 def parse_int(value: str, name: str, min_value: Optional[int] = None) -> int:
@@ -11,36 +11,91 @@ def parse_int(value: str, name: str, min_value: Optional[int] = None) -> int:
     return ivalue
 
 
+# --------------------- таблицы уровня модуля (строятся один раз) ---------------------
+
+_GENDERS = {"м": "М", "муж": "М", "мужской": "М", "m": "М",
+            "ж": "Ж", "жен": "Ж", "женский": "Ж", "f": "Ж"}
+
+_DAYS_IN_MONTH = (0, 31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+# разобранные даты: повторяющиеся строки не разбираются заново,
+# а одинаковые даты становятся одним объектом date
+_DATE_CACHE = {}
+_DATE_CACHE_LIMIT = 100_000
+
+
+def _fast_date(value: str) -> Optional[date]:
+    """DD.MM.YYYY или YYYY-MM-DD без strptime и исключений; None — формат не распознан."""
+    if len(value) != 10 or not value.isascii():
+        return None
+    if value[2] == "." and value[5] == ".":
+        d, m, y = value[0:2], value[3:5], value[6:10]
+    elif value[4] == "-" and value[7] == "-":
+        y, m, d = value[0:4], value[5:7], value[8:10]
+    else:
+        return None
+    if not (y.isdigit() and m.isdigit() and d.isdigit()):
+        return None
+    y, m, d = int(y), int(m), int(d)
+    if not (y >= 1 and 1 <= m <= 12 and 1 <= d <= _DAYS_IN_MONTH[m]):
+        return None
+    if m == 2 and d == 29 and not (y % 4 == 0 and (y % 100 != 0 or y % 400 == 0)):
+        return None
+    return date(y, m, d)
+
+
 def parse_date(value: str, name: str = "Дата") -> datetime.date:
     if not value:
         return None
-    for fmt in ("%d.%m.%Y", "%Y-%m-%d"):
-        try:
-            return datetime.strptime(value, fmt).date()
-        except ValueError:
-            pass
-    raise ValueError(f"{name}: неверный формат. Используйте DD.MM.YYYY или YYYY-MM-DD.")
+    cached = _DATE_CACHE.get(value)
+    if cached is not None:
+        return cached
+    result = _fast_date(value)
+    if result is None:
+        # редкие формы, которые понимает strptime (например 1.2.1990)
+        for fmt in ("%d.%m.%Y", "%Y-%m-%d"):
+            try:
+                result = datetime.strptime(value, fmt).date()
+                break
+            except ValueError:
+                pass
+        else:
+            raise ValueError(f"{name}: неверный формат. Используйте DD.MM.YYYY или YYYY-MM-DD.")
+    if len(_DATE_CACHE) >= _DATE_CACHE_LIMIT:
+        _DATE_CACHE.clear()
+    _DATE_CACHE[value] = result
+    return result
 
 
 def normalize_gender(value: str) -> str:
+    if value == "М" or value == "Ж":
+        return value
     v = (value or "").strip().lower()
-    mapping = {"м": "М", "муж": "М", "мужской": "М", "m": "М",
-               "ж": "Ж", "жен": "Ж", "женский": "Ж", "f": "Ж"}
-    if v in mapping:
-        return mapping[v]
+    if v in _GENDERS:
+        return _GENDERS[v]
     raise ValueError("Пол: укажите М/Ж.")
 
 
 def normalize_phone(value: str) -> str:
     if not value:
         return ""
-    allowed = "".join(ch for ch in value if ch.isdigit() or ch == "+")
-    digits = "".join(ch for ch in allowed if ch.isdigit())
+    # уже нормализованный номер (так его пишет save_teachers) возвращаем как есть
+    body = value[1:] if value[0] == "+" else value
+    if body.isdigit() and 10 <= len(body) <= 15:
+        return value
+    # один проход: цифры и признак «+ перед первой цифрой»
+    digits = []
+    plus = None
+    for ch in value:
+        if ch.isdigit():
+            digits.append(ch)
+            if plus is None:
+                plus = False
+        elif ch == "+" and plus is None:
+            plus = True
     if not (10 <= len(digits) <= 15):
         raise ValueError("Телефон: введите номер из 10–15 цифр (можно с +, пробелами и скобками).")
-    if allowed.startswith("+"):
-        return "+" + digits
-    return digits
+    return ("+" if plus else "") + "".join(digits)
 
 
 def nonempty(value: str, name: str) -> str:
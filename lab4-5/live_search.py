@@ -0,0 +1,144 @@
+"""
+live_search.py — поиск по дисциплине в фоновом потоке для окна ЛР5.
+
+Источник строк зависит от данных модели:
+  - RegistrySearch — реестр (TeacherRegistry): запрос идёт в его же
+    индекс дисциплин (DisciplineIndex), ничего не копируется. Реестр
+    тем временем может правиться в окне; ответ помечен версией модели
+    и отбрасывается окном, если версия успела смениться;
+  - SearchSnapshot — снимок .tsnap (только чтение): индекса у него нет,
+    поэтому при первом запросе строки группируются по дисциплине, дальше
+    запрос проверяет только различные дисциплины.
+Каждый запуск получает номер поколения: как только пришёл более новый
+запрос, старый поток бросает работу при ближайшей проверке.
+"""
+
+import heapq
+import queue
+import threading
+from itertools import islice
+from typing import Callable, Dict, List, Optional
+
+CHECK_EVERY = 1 << 14  # как часто (в строках) проверять отмену
+FIRST_BATCH = 500      # столько совпадений показывается сразу, остальные — следом
+
+
+class Cancelled(Exception):
+    pass
+
+
+class RegistrySearch:
+    """Поиск по индексу дисциплин реестра модели на момент version."""
+
+    def __init__(self, registry, version: int):
+        self.registry = registry
+        self.version = version
+
+    def search(self, query: str, cancelled: Callable[[], bool]):
+        """Итератор преподавателей, у которых дисциплина содержит query, в порядке списка."""
+        registry = self.registry
+        try:
+            slots = registry.discipline_slots(query.strip())
+            if cancelled():
+                raise Cancelled
+            # сначала — первые FIRST_BATCH по порядку, не сортируя все совпадения
+            first = heapq.nsmallest(FIRST_BATCH, slots)
+            yield from registry.at_slots(first)
+            if len(first) == FIRST_BATCH:
+                rest = sorted(s for s in slots if s > first[-1])
+                for n in range(0, len(rest), CHECK_EVERY):
+                    if cancelled():
+                        raise Cancelled
+                    yield from registry.at_slots(rest[n:n + CHECK_EVERY])
+        except (RuntimeError, KeyError):
+            # реестр изменили во время чтения: версия уже другая, окно
+            # всё равно повторит запрос
+            raise Cancelled
+
+
+class SearchSnapshot:
+    """Снимок .tsnap (или другая неизменяемая последовательность) на момент version."""
+
+    def __init__(self, data, version: int):
+        self.data = data
+        self.version = version
+        self._groups: Optional[Dict[str, List[int]]] = None
+        self._lock = threading.Lock()
+
+    def _disciplines(self):
+        # у снимка .tsnap можно прочитать одну колонку, не собирая Teacher
+        column = getattr(self.data, "column", None)
+        return column("discipline") if column else (t.discipline for t in self.data)
+
+    def groups(self) -> Dict[str, List[int]]:
+        """
+        Дисциплина (casefold) -> позиции строк по возрастанию; строится один
+        раз и не отменяется: группы того же снимка нужны следующему запросу.
+        """
+        with self._lock:
+            if self._groups is None:
+                groups: Dict[str, List[int]] = {}
+                for i, d in enumerate(self._disciplines()):
+                    d = (d or "").casefold()
+                    if d:
+                        groups.setdefault(d, []).append(i)
+                self._groups = groups
+            return self._groups
+
+    def search(self, query: str, cancelled: Callable[[], bool]):
+        """Итератор строк, у которых дисциплина содержит query, по порядку."""
+        q = query.strip().casefold()
+        lists = []
+        for n, (d, positions) in enumerate(self.groups().items()):
+            if n % 1024 == 0 and cancelled():
+                raise Cancelled
+            if q in d:
+                lists.append(positions)
+        positions = iter(lists[0]) if len(lists) == 1 else heapq.merge(*lists)
+        data = self.data
+        return (data[i] for i in positions)
+
+
+class LiveSearch:
+    """
+    Запускает поиск в потоке и складывает результаты в очередь results:
+        (поколение, query, version, строки, готово ли)
+    Сначала приходят первые FIRST_BATCH строк, затем (если их больше) — все.
+    Читать очередь и трогать виджеты — только в потоке Tk.
+    """
+
+    def __init__(self):
+        self.results: "queue.Queue" = queue.Queue()
+        self._generation = 0
+
+    def cancel(self) -> None:
+        self._generation += 1
+
+    def is_current(self, generation: int) -> bool:
+        return generation == self._generation
+
+    def start(self, snapshot, query: str) -> int:
+        """snapshot — RegistrySearch или SearchSnapshot."""
+        self._generation += 1
+        generation = self._generation
+        threading.Thread(target=self._run, args=(snapshot, query, generation), daemon=True).start()
+        return generation
+
+    def _run(self, snapshot, query: str, generation: int) -> None:
+        cancelled = lambda: generation != self._generation
+        put = self.results.put
+        try:
+            found = snapshot.search(query, cancelled)
+            first = list(islice(found, FIRST_BATCH))
+            if len(first) < FIRST_BATCH:
+                put((generation, query, snapshot.version, first, True))
+                return
+            put((generation, query, snapshot.version, first, False))
+            rows = list(first)  # first уже отдан окну
+            for n, t in enumerate(found):
+                if n % CHECK_EVERY == 0 and cancelled():
+                    return
+                rows.append(t)
+            put((generation, query, snapshot.version, rows, True))
+        except Cancelled:
+            pass
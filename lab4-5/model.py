@@ -3,7 +3,8 @@ from datetime import datetime
 from typing import Optional
 from controller import parse_int, parse_date, normalize_phone, normalize_gender
 
-@dataclass
+# slots=True: у объектов нет __dict__, на больших реестрах это основная экономия памяти
+@dataclass(slots=True)
 class Teacher:
     tab_number: int = field(default=0)
     fio: str = field(default="")
@@ -55,7 +56,20 @@ class Teacher:
         }
 
     @classmethod
-    def from_dict(cls, data: dict) -> "Teacher":
+    def from_dict(cls, data: dict, trusted: bool = False) -> "Teacher":
+        if trusted:
+            # данные записаны самим приложением (save_teachers): поля уже
+            # нормализованы, __post_init__ не нужен — только строка даты -> date
+            t = cls.__new__(cls)
+            t.tab_number = data.get("tab_number", 0)
+            t.fio = data.get("fio", "")
+            t.gender = data.get("gender", "")
+            t.birth_date = parse_date(data.get("birth_date"))
+            t.address = data.get("address", "")
+            t.phone = data.get("phone", "")
+            t.discipline = data.get("discipline", "")
+            t.experience_years = data.get("experience_years", 0)
+            return t
         return cls(
             tab_number=data.get("tab_number", 0),
             fio=data.get("fio", ""),
@@ -69,23 +83,311 @@ class Teacher:
 
 
 import json
-from typing import List
+import os
+from contextlib import contextmanager
+from typing import Callable, Iterable, Iterator, List, Optional, TextIO
 
-def save_teachers(path: str, teachers: List[Teacher]) -> None:
-    data = [t.to_dict() for t in teachers]
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+CHUNK_SIZE = 64 * 1024
+PROGRESS_STEP = 10_000  # как часто (в записях) сообщать о ходе сохранения
+_WS = " \t\n\r"
 
-def load_teachers(path: str) -> List[Teacher]:
-    with open(path, "r", encoding="utf-8") as f:
-        data = json.load(f)
-    result = [Teacher.from_dict(item) for item in data]
-    # ensure uniqueness of tab_number
+
+def iter_json_array(f: TextIO, chunk_size: int = CHUNK_SIZE) -> Iterator:
+    """
+    Элементы JSON-массива из файла по одному. В памяти — только текущий
+    кусок файла и один элемент, а не весь массив. После ']' до конца файла
+    допустимы только пробельные символы — как в json.load.
+    """
+    decoder = json.JSONDecoder()
+    buf, pos, eof = "", 0, False
+    # где в файле начинается buf: смещение, строк до него, начало его первой строки
+    base, lines, line_start = 0, 0, 0
+
+    def more():
+        nonlocal buf, pos, eof, base, lines, line_start
+        chunk = f.read(chunk_size)
+        eof = not chunk
+        nl = buf.rfind("\n", 0, pos)
+        if nl >= 0:
+            lines += buf.count("\n", 0, pos)
+            line_start = base + nl + 1
+        base += pos
+        buf, pos = buf[pos:] + chunk, 0
+        return not eof
+
+    def next_char():
+        nonlocal pos
+        while True:
+            while pos < len(buf) and buf[pos] in _WS:
+                pos += 1
+            if pos < len(buf) or not more():
+                return buf[pos] if pos < len(buf) else ""
+
+    def check_end():
+        # next_char() дочитывает файл, пока не встретит не пробельный символ
+        if not next_char():
+            return
+        # позиция — в файле, а не в текущем куске
+        nl = buf.rfind("\n", 0, pos)
+        lineno = lines + buf.count("\n", 0, pos) + 1
+        colno = pos - nl if nl >= 0 else base + pos - line_start + 1
+        err = json.JSONDecodeError("Extra data", buf, pos)
+        err.pos, err.lineno, err.colno = base + pos, lineno, colno
+        err.args = (f"Extra data: line {lineno} column {colno} (char {base + pos})",)
+        raise err
+
+    if next_char() != "[":
+        raise ValueError("Файл: ожидается JSON-массив записей.")
+    pos += 1
+    if next_char() == "]":
+        pos += 1
+        check_end()
+        return
+    while True:
+        next_char()
+        while True:
+            try:
+                item, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                more()
+                continue
+            # число на границе куска могло прочитаться не целиком («-2.5» из «-2.5e10»):
+            # за элементом должен быть виден разделитель
+            j = end
+            while j < len(buf) and buf[j] in _WS:
+                j += 1
+            if not eof and (j == len(buf) or buf[j] not in ",]"):
+                more()
+                continue
+            break
+        pos = end
+        yield item
+        sep = next_char()
+        pos += 1
+        if sep == "]":
+            check_end()
+            return
+        if sep != ",":
+            raise ValueError("Файл: ожидается ',' или ']' между записями.")
+
+
+def iter_teachers(path: str, trusted: bool = False) -> Iterator[Teacher]:
+    """Преподаватели из файла по одному; повторный табельный номер пропускается."""
     seen = set()
-    uniq = []
-    for t in result:
-        if t.tab_number in seen:
-            continue
-        seen.add(t.tab_number)
-        uniq.append(t)
-    return uniq
+    with open(path, "r", encoding="utf-8") as f:
+        for item in iter_json_array(f):
+            t = Teacher.from_dict(item, trusted)
+            if t.tab_number in seen:
+                continue
+            seen.add(t.tab_number)
+            yield t
+
+
+def write_teachers(f: TextIO, teachers: Iterable[Teacher], compact: bool = False,
+                   progress: Optional[Callable[[int], None]] = None) -> None:
+    """
+    Пишет записи по одной. Обычный вид совпадает с json.dump(..., indent=2),
+    compact=True — без отступов, по записи на строку.
+    progress(n) вызывается каждые PROGRESS_STEP записей.
+    """
+    f.write("[")
+    first = True
+    for n, t in enumerate(teachers, 1):
+        if progress is not None and n % PROGRESS_STEP == 0:
+            progress(n)
+        if compact:
+            text = json.dumps(t.to_dict(), ensure_ascii=False, separators=(",", ":"))
+            f.write(("\n" if first else ",\n") + text)
+        else:
+            text = json.dumps(t.to_dict(), ensure_ascii=False, indent=2)
+            f.write(("\n  " if first else ",\n  ") + text.replace("\n", "\n  "))
+        first = False
+    f.write("]" if first else "\n]")
+
+
+@contextmanager
+def atomic_open(path: str, mode: str = "w"):
+    """
+    Файл для записи вместо path: данные пишутся во временный файл рядом,
+    после fsync он заменяет path через os.replace. Сбой посреди записи
+    оставляет прежний файл нетронутым.
+    """
+    tmp = f"{path}.{os.getpid()}.tmp"
+    f = open(tmp, mode, encoding=None if "b" in mode else "utf-8")
+    try:
+        yield f
+        f.flush()
+        os.fsync(f.fileno())
+    except BaseException:
+        f.close()
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+    f.close()
+    os.replace(tmp, path)
+    if os.name == "posix":
+        # сама замена тоже должна пережить сбой
+        fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+
+def save_teachers(path: str, teachers: Iterable[Teacher], compact: bool = False,
+                  progress: Optional[Callable[[int], None]] = None) -> None:
+    with atomic_open(path) as f:
+        write_teachers(f, teachers, compact, progress)
+
+
+def load_teachers(path: str, trusted: bool = False) -> List[Teacher]:
+    """trusted=True — файл записан save_teachers, повторная проверка полей пропускается."""
+    return list(iter_teachers(path, trusted))
+
+
+# события изменения списка: listener(event, index, old, new)
+INSERTED, UPDATED, REMOVED, RESET = "inserted", "updated", "removed", "reset"
+
+
+class TeacherModel:
+    """
+    Список преподавателей с уведомлениями об изменениях. Данные — реестр
+    (TeacherRegistry из ЛР3) или снимок .tsnap; после каждой правки
+    подписчики получают (событие, позиция, старый, новый), и вид
+    обновляет только затронутую строку.
+    """
+
+    def __init__(self, data):
+        self.data = data
+        self.version = 0  # растёт с каждым изменением: по нему видно, что снимок устарел
+        self._listeners: List[Callable] = []
+
+    def subscribe(self, listener: Callable) -> None:
+        self._listeners.append(listener)
+
+    def _emit(self, event: str, index: Optional[int] = None, old=None, new=None) -> None:
+        self.version += 1
+        for listener in self._listeners:
+            listener(event, index, old, new)
+
+    def reset(self, data) -> None:
+        """Подменить данные целиком (открыт другой файл и т. п.)."""
+        self.data = data
+        self._emit(RESET)
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __iter__(self) -> Iterator[Teacher]:
+        return iter(self.data)
+
+    def __getitem__(self, index: int) -> Teacher:
+        return self.data[index]
+
+    def __contains__(self, tab_number: int) -> bool:
+        return tab_number in self.data
+
+    def position(self, tab_number: int) -> Optional[int]:
+        return self.data.position(tab_number)
+
+    def search_discipline(self, query: str) -> List[Teacher]:
+        return self.data.search_discipline(query)
+
+    def append(self, teacher: Teacher) -> None:
+        self.data.append(teacher)
+        self._emit(INSERTED, len(self.data) - 1, None, teacher)
+
+    def __setitem__(self, index: int, teacher: Teacher) -> None:
+        old = self.data[index]
+        self.data[index] = teacher
+        self._emit(UPDATED, index, old, teacher)
+
+    def __delitem__(self, index: int) -> None:
+        old = self.data[index]
+        del self.data[index]
+        self._emit(REMOVED, index, old, None)
+
+
+class FilteredTeachers:
+    """
+    Результат поиска по дисциплине поверх TeacherModel. Строки идут в
+    порядке модели; позиция строки в модели берётся через position()
+    по табельному номеру, так что сдвиги после вставок и удалений не
+    требуют пересчёта. apply() переводит событие модели в событие для
+    отфильтрованного списка (или None, если строка в него не входит).
+    """
+
+    def __init__(self, model: TeacherModel, query: str, rows: Optional[List[Teacher]] = None):
+        """rows — готовый результат (например, из фонового поиска) вместо запроса к модели."""
+        self._model = model
+        self.query = query.strip().casefold()
+        self.rebuild(rows)
+
+    def rebuild(self, rows: Optional[List[Teacher]] = None) -> None:
+        self._rows: List[Teacher] = self._model.search_discipline(self.query) if rows is None else rows
+        self._tabs = {t.tab_number for t in self._rows}
+
+    def matches(self, teacher: Teacher) -> bool:
+        return self.query in (teacher.discipline or "").casefold()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __getitem__(self, i: int) -> Teacher:
+        return self._rows[i]
+
+    def __iter__(self) -> Iterator[Teacher]:
+        return iter(self._rows)
+
+    def source_index(self, i: int) -> int:
+        """Позиция i-й строки результата в модели."""
+        return self._model.position(self._rows[i].tab_number)
+
+    def _locate(self, index: float, skip: Optional[int] = None, skip_rank: float = 0) -> int:
+        # первая строка с позицией в модели >= index; у строки skip
+        # позиция уже не определена (удалена или сменила номер) — берём skip_rank
+        rows, position = self._rows, self._model.position
+        lo, hi = 0, len(rows)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            tab = rows[mid].tab_number
+            rank = skip_rank if tab == skip else position(tab)
+            if rank < index:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def apply(self, event: str, index: int, old: Optional[Teacher], new: Optional[Teacher]):
+        """Событие модели -> (событие, позиция в результате) или None."""
+        was = old is not None and old.tab_number in self._tabs
+        now = new is not None and self.matches(new)
+        if event == INSERTED and now:
+            j = self._locate(index)
+            self._rows.insert(j, new)
+            self._tabs.add(new.tab_number)
+            return INSERTED, j
+        if event == REMOVED and was:
+            # удалённая строка стояла между позициями index - 1 и index
+            j = self._locate(index - 0.5, old.tab_number, index - 0.5)
+            del self._rows[j]
+            self._tabs.discard(old.tab_number)
+            return REMOVED, j
+        if event == UPDATED and (was or now):
+            j = self._locate(index, old.tab_number, index)
+            self._tabs.discard(old.tab_number)
+            if was and now:
+                self._rows[j] = new
+                self._tabs.add(new.tab_number)
+                return UPDATED, j
+            if was:
+                del self._rows[j]
+                return REMOVED, j
+            self._rows.insert(j, new)
+            self._tabs.add(new.tab_number)
+            return INSERTED, j
+        return None
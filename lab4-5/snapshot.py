@@ -0,0 +1,196 @@
+"""
+snapshot.py — двоичный колоночный снимок списка преподавателей (.tsnap).
+
+Устройство файла (все числа little-endian):
+    заголовок: сигнатура, число записей n, смещения 13 секций;
+    числовые колонки фиксированной ширины:
+        tab_number        int64[n]
+        experience_years  int64[n]
+        birth_date        int32[n] — date.toordinal(), 0 — дата не указана;
+    строковые колонки fio, gender, address, phone, discipline —
+        смещения uint64[n + 1] и куча байтов UTF-8 (строка i — байты
+        offsets[i]:offsets[i + 1]).
+Файл открывается через mmap: открытие не зависит от числа записей,
+объект Teacher собирается только при обращении к строке.
+
+Конвертация из/в JSON (формат save_teachers):
+    python snapshot.py teachers.json teachers.tsnap
+    python snapshot.py teachers.tsnap teachers.json
+"""
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Sequence
+from datetime import date
+from typing import Callable, Iterable, List, Optional
+
+from model import PROGRESS_STEP, Teacher, atomic_open, iter_teachers, save_teachers
+
+MAGIC = b"TSNAP\x00\x01\x00"
+STRINGS = ("fio", "gender", "address", "phone", "discipline")
+# сигнатура, n, смещения: 3 числовые колонки + (смещения, куча) на каждую строковую
+_HEADER = struct.Struct("<8sQ" + "Q" * (3 + 2 * len(STRINGS)))
+_I64 = struct.Struct("<q")
+_I32 = struct.Struct("<i")
+_U64 = struct.Struct("<Q")
+_PAIR = struct.Struct("<QQ")
+
+
+def _le(a: array) -> bytes:
+    if sys.byteorder != "little":
+        a = array(a.typecode, a)
+        a.byteswap()
+    return a.tobytes()
+
+
+def write_snapshot(path: str, teachers: Iterable[Teacher],
+                   progress: Optional[Callable[[int], None]] = None) -> int:
+    """
+    Записывает снимок (через atomic_open — открытый снимок того же
+    файла продолжает читаться). Возвращает число записей.
+    """
+    tabs, exps, births = array("q"), array("q"), array("i")
+    offsets = {name: array("Q", [0]) for name in STRINGS}
+    heaps = {name: bytearray() for name in STRINGS}
+    for n, t in enumerate(teachers, 1):
+        if progress is not None and n % PROGRESS_STEP == 0:
+            progress(n)
+        tabs.append(t.tab_number)
+        exps.append(t.experience_years)
+        births.append(t.birth_date.toordinal() if t.birth_date else 0)
+        for name in STRINGS:
+            heap = heaps[name]
+            heap += (getattr(t, name) or "").encode("utf-8")
+            offsets[name].append(len(heap))
+
+    sections = [_le(tabs), _le(exps), _le(births)]
+    for name in STRINGS:
+        sections += [_le(offsets[name]), bytes(heaps[name])]
+    starts, pos = [], _HEADER.size
+    for data in sections:
+        pos += -pos % 8  # выравнивание секций по 8 байтам
+        starts.append(pos)
+        pos += len(data)
+
+    with atomic_open(path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, len(tabs), *starts))
+        for start, data in zip(starts, sections):
+            f.write(b"\0" * (start - f.tell()))
+            f.write(data)
+    return len(tabs)
+
+
+class Snapshot(Sequence):
+    """
+    Снимок, открытый только для чтения. Ведёт себя как последовательность
+    Teacher: snap[i] читает строку i прямо из отображённого файла.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size < _HEADER.size:
+                raise ValueError(f"{path}: не снимок преподавателей.")
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self._n, *starts = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            self._mm.close()
+            raise ValueError(f"{path}: не снимок преподавателей.")
+        self._tab, self._exp, self._birth = starts[:3]
+        self._strings = {name: (starts[3 + 2 * k], starts[4 + 2 * k]) for k, name in enumerate(STRINGS)}
+        self._positions: Optional[dict] = None
+
+    def close(self) -> None:
+        self._mm.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self) -> int:
+        return self._n
+
+    def tab_number(self, i: int) -> int:
+        return _I64.unpack_from(self._mm, self._tab + 8 * i)[0]
+
+    def string(self, name: str, i: int) -> str:
+        offsets, heap = self._strings[name]
+        a, b = _PAIR.unpack_from(self._mm, offsets + 8 * i)
+        return self._mm[heap + a:heap + b].decode("utf-8")
+
+    def column(self, name: str):
+        """Значения одной строковой колонки по порядку, без сборки Teacher."""
+        offsets, heap = self._strings[name]
+        mm = self._mm
+        for i in range(self._n):
+            a, b = _PAIR.unpack_from(mm, offsets + 8 * i)
+            yield mm[heap + a:heap + b].decode("utf-8")
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[k] for k in range(*i.indices(self._n))]
+        if i < 0:
+            i += self._n
+        if not 0 <= i < self._n:
+            raise IndexError("Нет элемента с таким номером.")
+        ordinal = _I32.unpack_from(self._mm, self._birth + 4 * i)[0]
+        return Teacher(
+            tab_number=self.tab_number(i),
+            fio=self.string("fio", i),
+            gender=self.string("gender", i),
+            birth_date=date.fromordinal(ordinal) if ordinal else None,
+            address=self.string("address", i),
+            phone=self.string("phone", i),
+            discipline=self.string("discipline", i),
+            experience_years=_I64.unpack_from(self._mm, self._exp + 8 * i)[0],
+        )
+
+    def __iter__(self):
+        for i in range(self._n):
+            yield self[i]
+
+    def position(self, tab_number: int) -> Optional[int]:
+        """Строка с таким табельным номером; индекс по колонке строится при первом вызове."""
+        if self._positions is None:
+            self._positions = {self.tab_number(i): i for i in range(self._n)}
+        return self._positions.get(tab_number)
+
+    def search_discipline(self, query: str) -> List[Teacher]:
+        """Строки, у которых дисциплина содержит query; читается только колонка дисциплин."""
+        q = query.strip().casefold()
+        return [self[i] for i, d in enumerate(self.column("discipline")) if q in d.casefold()]
+
+
+def json_to_snapshot(src: str, dst: str) -> int:
+    # src может быть любым JSON, не только файлом save_teachers: поля проверяются
+    # и нормализуются, как при открытии файла (trusted только для своих данных)
+    return write_snapshot(dst, iter_teachers(src))
+
+
+def snapshot_to_json(src: str, dst: str, compact: bool = False) -> int:
+    with Snapshot(src) as snap:
+        save_teachers(dst, snap, compact)
+        return len(snap)
+
+
+def main(argv):
+    if len(argv) != 3:
+        print(__doc__)
+        return 2
+    src, dst = argv[1], argv[2]
+    if dst.lower().endswith(".tsnap"):
+        n = json_to_snapshot(src, dst)
+    else:
+        n = snapshot_to_json(src, dst)
+    print(f"Записей: {n}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
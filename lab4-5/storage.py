@@ -0,0 +1,217 @@
+"""
+storage.py — журнал изменений в формате JSON Lines (.jsonl).
+
+Каждая строка файла — одна запись об изменении:
+    {"op": "put", "data": {...}}               — добавить или заменить преподавателя
+    {"op": "put", "old": 5, "data": {...}}     — заменить преподавателя #5 (номер мог смениться)
+    {"op": "del", "tab_number": 5}             — удалить преподавателя #5
+Добавление, изменение и удаление дописывают строку в конец файла, поэтому
+сохранение стоит O(изменений), а не O(записей). При открытии журнал
+проигрывается с начала. Когда устаревших строк становится много, файл
+в фоне переписывается заново — по одной строке put на живую запись.
+"""
+
+import json
+import os
+import sys
+import threading
+from typing import Callable, Iterable, List, Optional, Sized, Tuple
+
+from model import PROGRESS_STEP, Teacher, atomic_open
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "lab3"))
+from registry import TeacherRegistry
+
+# сжатие запускается, когда устаревших строк не меньше MIN_GARBAGE
+# и они составляют больше GARBAGE_RATIO от всего файла
+MIN_GARBAGE = 1000
+GARBAGE_RATIO = 0.5
+
+
+def _line(record: dict) -> str:
+    return json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+
+
+def put_record(teacher: Teacher, old: Optional[int] = None) -> str:
+    record = {"op": "put", "data": teacher.to_dict()}
+    if old is not None and old != teacher.tab_number:
+        record["old"] = old
+    return _line(record)
+
+
+def del_record(tab_number: int) -> str:
+    return _line({"op": "del", "tab_number": tab_number})
+
+
+def replay(path: str) -> Tuple[TeacherRegistry, int]:
+    """Последнее состояние по журналу: (реестр, число строк в файле)."""
+    teachers = TeacherRegistry()
+    lines = 0
+    with open(path, "r", encoding="utf-8") as f:
+        for lineno, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            lines += 1
+            try:
+                record = json.loads(line)
+                op = record["op"]
+                if op == "put":
+                    # журнал пишет само приложение — поля уже проверены
+                    t = Teacher.from_dict(record["data"], trusted=True)
+                    idx = teachers.position(record.get("old", t.tab_number))
+                    if idx is None:
+                        teachers.add(t)
+                    else:
+                        teachers.replace_at(idx, t)
+                elif op == "del":
+                    idx = teachers.position(record["tab_number"])
+                    if idx is not None:
+                        teachers.remove_at(idx)
+                else:
+                    raise ValueError(f"неизвестная операция {op!r}")
+            except (ValueError, KeyError, TypeError) as e:
+                raise ValueError(f"Журнал {path}, строка {lineno}: {e}")
+    return teachers, lines
+
+
+class JournalStore:
+    """
+    Журнал изменений одного файла. Изменения копятся в памяти (put/delete)
+    и дописываются в файл при save() (или take() в потоке правок и write()
+    в фоновом). Сжатие идёт в отдельном потоке по снимку записей; строки,
+    дописанные за это время, переносятся в новый файл перед заменой старого.
+    """
+
+    def __init__(self, path: str, lines: int = 0):
+        self.path = path
+        self._lines = lines            # строк в файле на диске
+        self._pending: List[str] = []  # ещё не взятые изменения
+        # _lock — только очередь изменений (put/delete/take из потока окна),
+        # под ним нет файловых операций; _io_lock — запись в файл и замена
+        # файла при сжатии, его держит фоновый поток на время fsync
+        self._lock = threading.Lock()
+        self._io_lock = threading.Lock()
+        self._compacting = False
+        self._tail: List[str] = []     # строки, дописанные во время сжатия
+        self._thread: Optional[threading.Thread] = None
+        self.last_error: Optional[Exception] = None
+
+    @classmethod
+    def open(cls, path: str) -> Tuple["JournalStore", TeacherRegistry]:
+        teachers, lines = replay(path)
+        return cls(path, lines), teachers
+
+    @classmethod
+    def create(cls, path: str, teachers: Iterable[Teacher]) -> "JournalStore":
+        """Новый журнал со всеми записями teachers (экспорт из .json)."""
+        store = cls(path)
+        store.rewrite(teachers)
+        return store
+
+    def rewrite(self, teachers: Iterable[Teacher],
+                progress: Optional[Callable[[int], None]] = None) -> None:
+        """
+        Переписывает файл целиком (через atomic_open). Накопленные
+        put/delete не трогаются — они будут дописаны следующим save().
+        """
+        lines = 0
+        with atomic_open(self.path) as f:
+            for t in teachers:
+                f.write(put_record(t))
+                lines += 1
+                if progress is not None and lines % PROGRESS_STEP == 0:
+                    progress(lines)
+        with self._io_lock:
+            self._lines = lines
+
+    @property
+    def dirty(self) -> bool:
+        return bool(self._pending)
+
+    def put(self, teacher: Teacher, old: Optional[int] = None) -> None:
+        """Добавление или замена; old — прежний табельный номер при замене."""
+        line = put_record(teacher, old)
+        with self._lock:  # save() может идти в фоновом потоке
+            self._pending.append(line)
+
+    def delete(self, tab_number: int) -> None:
+        line = del_record(tab_number)
+        with self._lock:
+            self._pending.append(line)
+
+    def take(self, teachers: Sized) -> Tuple[List[str], Optional[Tuple[Teacher, ...]]]:
+        """
+        Забирает накопленные изменения — в том же потоке, что put/delete.
+        Стоит O(изменений): снимок teachers (кортеж, O(n)) берётся, только
+        если после записи этих строк пора сжимать файл. Он берётся в тот же
+        момент, что и строки, поэтому совпадает с файлом после их записи
+        и сжатие по нему не теряет правок. Результат передаётся в write().
+        """
+        with self._lock:
+            lines, self._pending = self._pending, []
+        # _lines меняет фоновый write(); для решения о сжатии хватает оценки
+        total = self._lines + len(lines)
+        garbage = total - len(teachers)
+        snapshot = None
+        if (not self._compacting and garbage >= MIN_GARBAGE
+                and garbage > GARBAGE_RATIO * total):
+            # объекты Teacher в реестре не изменяются, а заменяются —
+            # кортеж ссылок достаточен как снимок
+            snapshot = teachers if isinstance(teachers, tuple) else tuple(teachers)
+        return lines, snapshot
+
+    def write(self, batch: Tuple[List[str], Optional[Tuple[Teacher, ...]]]) -> None:
+        """
+        Дописывает изменения, взятые take(), и при необходимости запускает
+        сжатие; можно вызывать из фонового потока. put/delete/take в это
+        время не ждут: запись идёт под _io_lock, а не под _lock.
+        """
+        lines, snapshot = batch
+        with self._io_lock:
+            if lines:
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.writelines(lines)
+                    f.flush()
+                    os.fsync(f.fileno())
+                self._lines += len(lines)
+                if self._compacting:
+                    self._tail.extend(lines)
+            if snapshot is not None and not self._compacting:
+                self._compacting = True
+                self._tail = []
+                self._thread = threading.Thread(target=self._compact, args=(snapshot,), daemon=True)
+                self._thread.start()
+
+    def save(self, teachers: Sized) -> None:
+        """take() и write() за один вызов — когда правки идут в этом же потоке."""
+        self.write(self.take(teachers))
+
+    def _compact(self, snapshot: Tuple[Teacher, ...]) -> None:
+        tmp = self.path + ".compact"
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                for t in snapshot:
+                    f.write(put_record(t))
+            with self._io_lock:
+                with open(tmp, "a", encoding="utf-8") as f:
+                    f.writelines(self._tail)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp, self.path)
+                self._lines = len(snapshot) + len(self._tail)
+        except OSError as e:
+            self.last_error = e
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+        finally:
+            with self._io_lock:
+                self._compacting = False
+                self._tail = []
+
+    def wait(self) -> None:
+        """Дождаться окончания фонового сжатия (перед выходом или сменой файла)."""
+        thread = self._thread
+        if thread is not None:
+            thread.join()
@@ -1,9 +1,34 @@
+import os
+import queue
+import sys
+import threading
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-from typing import List
 from typing import Optional
-from model import Teacher, save_teachers, load_teachers
+from model import (Teacher, TeacherModel, FilteredTeachers, save_teachers, iter_teachers,
+                   INSERTED, UPDATED, RESET)
+
+# реестр с индексами по табельному номеру и дисциплине — из ЛР3
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "lab3"))
+from registry import TeacherRegistry
 from controller import parse_int, parse_date, normalize_phone, normalize_gender, nonempty
+from storage import JournalStore
+from snapshot import Snapshot, write_snapshot
+from vlist import VirtualList
+from live_search import LiveSearch, RegistrySearch, SearchSnapshot
+
+SEARCH_DELAY_MS = 250  # поиск запускается, когда ввод затих на это время
+
+FILETYPES = [("JSON файлы", "*.json"), ("Журнал JSONL", "*.jsonl"),
+             ("Снимок (двоичный)", "*.tsnap"), ("Все файлы", "*.*")]
+
+
+def is_journal(path: str) -> bool:
+    return path.lower().endswith(".jsonl")
+
+
+def is_snapshot(path: str) -> bool:
+    return path.lower().endswith(".tsnap")
 
 
 class App(tk.Tk):
@@ -15,9 +40,24 @@ class App(tk.Tk):
 
         # текущий открытый файл
         self.current_file: Optional[str] = None
+        # журнал изменений, если открыт .jsonl; для .json — None
+        self.store: Optional[JournalStore] = None
+        # фоновое сохранение: поток и очередь сообщений от него
+        self._save_thread: Optional[threading.Thread] = None
+        self._save_queue: "queue.Queue" = queue.Queue()
         self._build_menu()
 
-        self.teachers: List[Teacher] = []
+        # правки модели приходят в _on_model_change событиями
+        self.teachers = TeacherModel(TeacherRegistry())
+        self.teachers.subscribe(self._on_model_change)
+        # результат поиска, если в списке показан он, а не весь реестр
+        self._filter: Optional[FilteredTeachers] = None
+        # поиск по мере ввода: отложенный запуск, фоновый поток и снимок для него
+        self._live = LiveSearch()
+        self._search_snapshot: Optional[SearchSnapshot] = None
+        self._search_after = None
+        self._search_waiting = False
+        self._search_polling = False
 
         self._build_search_bar()
 
@@ -29,7 +69,7 @@ class App(tk.Tk):
         self._build_form_panel()
 
         self._build_actions_panel()
-
+        self._build_status_bar()
 
 
     def _build_menu(self):
@@ -40,6 +80,8 @@ class App(tk.Tk):
         filemenu.add_separator()
         filemenu.add_command(label="Сохранить", command=self.menu_save)
         filemenu.add_command(label="Сохранить как…", command=self.menu_save_as)
+        self.compact_json_var = tk.BooleanVar(value=False)
+        filemenu.add_checkbutton(label="Компактный JSON (без отступов)", variable=self.compact_json_var)
         filemenu.add_separator()
         filemenu.add_command(label="Выход", command=self.menu_exit)
         menubar.add_cascade(label="Файл", menu=filemenu)
@@ -53,19 +95,33 @@ class App(tk.Tk):
     def menu_new(self):
         if self.teachers and not messagebox.askyesno("Создать", "Очистить текущие данные?"):
             return
-        self.teachers.clear()
+        self._filter = None
+        self._set_teachers(TeacherRegistry())
         self.refresh_listbox()
         self.clear_form()
         self.current_file = None
+        self._close_store()
         self.title("ЛР5 — Преподаватели (новый файл)")
 
     def menu_open(self):
-        path = filedialog.askopenfilename(title="Открыть файл",
-                                          filetypes=[("JSON файлы","*.json"), ("Все файлы","*.*")])
+        path = filedialog.askopenfilename(title="Открыть файл", filetypes=FILETYPES)
         if not path:
             return
         try:
-            self.teachers = load_teachers(path)
+            if is_journal(path):
+                store, teachers = JournalStore.open(path)
+                self._close_store()
+                self.store = store
+            elif is_snapshot(path):
+                # mmap: записи читаются с диска при показе строки
+                teachers = Snapshot(path)
+                self._close_store()
+            else:
+                # записи читаются из файла по одной, без промежуточного списка
+                teachers = TeacherRegistry(iter_teachers(path))
+                self._close_store()
+            self._filter = None
+            self._set_teachers(teachers)
             self.refresh_listbox()
             self.clear_form()
             self.current_file = path
@@ -77,25 +133,144 @@ class App(tk.Tk):
     def menu_save(self):
         if not self.current_file:
             return self.menu_save_as()
+        if self._save_thread is not None:
+            messagebox.showwarning("Сохранение", "Предыдущее сохранение ещё не закончено.")
+            return
+        path = self.current_file
+        data = self.teachers.data
+        if self.store is not None:
+            # дописываются только изменения с прошлого сохранения — O(правок);
+            # строки забираются здесь же: правка после этой точки уйдёт в
+            # следующее сохранение. Снимок реестра take() делает сам и только
+            # если пора сжимать журнал
+            store = self.store
+            batch = store.take(data)
+            job = lambda progress: store.write(batch)
+        else:
+            # поток пишет неизменяемый снимок: реестр тем временем можно править.
+            # Teacher при правке заменяются, а не изменяются, поэтому хватает кортежа ссылок;
+            # снимок .tsnap и так только читается
+            items = data if isinstance(data, Snapshot) else tuple(data)
+            if is_journal(path):
+                # журнал заводится сразу: правки во время записи попадут в следующий save()
+                self.store = store = JournalStore(path)
+                job = lambda progress: store.rewrite(items, progress)
+            elif is_snapshot(path):
+                job = lambda progress: write_snapshot(path, items, progress)
+            else:
+                compact = self.compact_json_var.get()
+                job = lambda progress: save_teachers(path, items, compact, progress)
+
+        self.progress.configure(maximum=max(len(data), 1), value=0)
+        self.status_var.set(f"Сохранение: {path}")
+        self._save_thread = threading.Thread(target=self._save_worker, args=(job,), daemon=True)
+        self._save_thread.start()
+        self.after(100, self._poll_save, path)
+
+    def _save_worker(self, job):
+        # Tk нельзя трогать из этого потока — только очередь
+        put = self._save_queue.put
         try:
-            save_teachers(self.current_file, self.teachers)
-            messagebox.showinfo("Сохранено", f"Файл обновлён:\n{self.current_file}")
+            job(lambda n: put(("progress", n)))
+            put(("done", None))
         except Exception as e:
-            messagebox.showerror("Ошибка сохранения", str(e))
+            put(("error", str(e)))
+
+    def _poll_save(self, path):
+        finished = False
+        try:
+            while True:
+                kind, value = self._save_queue.get_nowait()
+                if kind == "progress":
+                    self.progress.configure(value=value)
+                    self.status_var.set(f"Сохранение: {path} — записей {value}")
+                else:
+                    finished = True
+                    self._save_thread = None
+                    self.progress.configure(value=0)
+                    self.status_var.set("")
+                    if kind == "done":
+                        messagebox.showinfo("Сохранено", f"Файл обновлён:\n{path}")
+                    else:
+                        messagebox.showerror("Ошибка сохранения", value)
+        except queue.Empty:
+            pass
+        if not finished:
+            self.after(100, self._poll_save, path)
 
     def menu_save_as(self):
         path = filedialog.asksaveasfilename(title="Сохранить как",
                                             defaultextension=".json",
-                                            filetypes=[("JSON файлы","*.json"), ("Все файлы","*.*")])
+                                            filetypes=FILETYPES)
         if not path:
             return
+        if self._save_thread is not None:
+            messagebox.showwarning("Сохранение", "Предыдущее сохранение ещё не закончено.")
+            return
+        # «Сохранить как» всегда пишет файл целиком: экспорт журнала в .json и наоборот
+        self._close_store()
         self.current_file = path
         self.menu_save()
 
     def menu_exit(self):
         if messagebox.askokcancel("Выход", "Выйти из программы?"):
+            if self._save_thread is not None:
+                # прежний файл цел в любом случае, но начатое сохранение лучше довести
+                self.status_var.set("Завершается сохранение…")
+                self.update_idletasks()
+                self._save_thread.join()
+            self._close_store()
             self.destroy()
 
+    def _set_teachers(self, teachers):
+        # mmap снимка .tsnap закрывается сам, когда на него не остаётся ссылок
+        # (ссылку может держать и фоновое сохранение)
+        self.teachers.reset(teachers)
+
+    def _editable(self) -> TeacherModel:
+        """Снимок .tsnap только читается: перед первым изменением записи переносятся в реестр."""
+        if isinstance(self.teachers.data, Snapshot):
+            self._set_teachers(TeacherRegistry(self.teachers.data))
+        return self.teachers
+
+    def _on_model_change(self, event, index, old, new):
+        if event == RESET:
+            if self._filter is not None:
+                self._filter.rebuild()
+            self.listbox.set_rows(self._shown(), reset=False)
+            return
+        if self.store is not None:
+            if new is None:
+                self.store.delete(old.tab_number)
+            else:
+                self.store.put(new, old.tab_number if old is not None else None)
+        # в список — только дельта: одна строка, без перезаполнения
+        delta = (event, index) if self._filter is None else self._filter.apply(event, index, old, new)
+        if delta is None:
+            return
+        kind, row = delta
+        if kind == INSERTED:
+            self.listbox.inserted(row)
+        elif kind == UPDATED:
+            self.listbox.update_row(row)
+        else:
+            self.listbox.removed(row)
+
+    def _shown(self):
+        return self.teachers if self._filter is None else self._filter
+
+    def _selected_index(self) -> Optional[int]:
+        """Позиция выделенного преподавателя в реестре (с учётом поиска)."""
+        sel = self.listbox.curselection()
+        if not sel:
+            return None
+        return sel[0] if self._filter is None else self._filter.source_index(sel[0])
+
+    def _close_store(self):
+        if self.store is not None:
+            self.store.wait()
+            self.store = None
+
     def menu_about(self):
         messagebox.showinfo("О программе",
                             "Программа: Список преподавателей\nЛР5 — работа с файлами\nРазработчик: Андрюха")
@@ -104,6 +279,7 @@ class App(tk.Tk):
         bar.grid(row=0, column=0, columnspan=2, sticky="ew")
         ttk.Label(bar, text="Поиск по дисциплине:").pack(side="left")
         self.search_var = tk.StringVar()
+        self.search_var.trace_add("write", self._on_search_typed)
         ttk.Entry(bar, textvariable=self.search_var, width=30).pack(side="left", padx=6)
         ttk.Button(bar, text="Найти", command=self.search).pack(side="left")
         ttk.Button(bar, text="Сброс", command=self.reset_search).pack(side="left", padx=(6,0))
@@ -117,15 +293,11 @@ class App(tk.Tk):
         left.rowconfigure(1, weight=1)
         ttk.Label(left, text="Преподаватели").grid(row=0, column=0, sticky="w")
 
-        self.listbox = tk.Listbox(left, exportselection=False)
-        self.listbox.config(width=90)
+        # в виджете только видимые строки, short() вызывается при показе
+        self.listbox = VirtualList(left, self.teachers, Teacher.short, width=90)
         self.listbox.grid(row=1, column=0, sticky="nsew")
         self.listbox.bind("<<ListboxSelect>>", self.on_select)
 
-        scroll = ttk.Scrollbar(left, command=self.listbox.yview)
-        self.listbox.configure(yscrollcommand=scroll.set)
-        scroll.grid(row=1, column=1, sticky="ns")
-
     def _build_form_panel(self):
         right = ttk.Frame(self, padding=(0,0,8,8))
         right.grid(row=1, column=1, sticky="nsew")
@@ -179,6 +351,15 @@ class App(tk.Tk):
         ttk.Button(panel, text="Показать информацию", command=self.show_selected_info).grid(row=0, column=3, sticky="ew", padx=4)
 
 
+    def _build_status_bar(self):
+        bar = ttk.Frame(self, padding=(8,0,8,8))
+        bar.grid(row=3, column=0, columnspan=2, sticky="ew")
+        bar.columnconfigure(0, weight=1)
+        self.status_var = tk.StringVar()
+        ttk.Label(bar, textvariable=self.status_var).grid(row=0, column=0, sticky="w")
+        self.progress = ttk.Progressbar(bar, mode="determinate", length=240)
+        self.progress.grid(row=0, column=1, sticky="e")
+
     def validate_form(self) -> Teacher:
         try:
             tab_number = parse_int(self.vars["tab_number"].get(), "Табельный номер", 1)
@@ -200,68 +381,114 @@ class App(tk.Tk):
         except ValueError:
             return
         # проверка уникальности табельного номера
-        if any(x.tab_number == t.tab_number for x in self.teachers):
+        if t.tab_number in self._editable():
             messagebox.showwarning("Дубликат", f"Преподаватель с табельным номером {t.tab_number} уже есть.")
             return
         self.teachers.append(t)
-        self.refresh_listbox()
         messagebox.showinfo("Готово", "Преподаватель добавлен.")
 
     def update_teacher(self):
-        sel = self.listbox.curselection()
-        if not sel:
+        idx = self._selected_index()
+        if idx is None:
             messagebox.showwarning("Нет выбора", "Выберите преподавателя в списке.")
             return
-        idx = sel[0]
         try:
             t = self.validate_form()
         except ValueError:
             return
-        if any(x.tab_number == t.tab_number for i, x in enumerate(self.teachers) if i != idx):
+        if self._editable().position(t.tab_number) not in (None, idx):
             messagebox.showwarning("Дубликат", f"Табельный номер {t.tab_number} уже используется.")
             return
         self.teachers[idx] = t
-        self.refresh_listbox()
         messagebox.showinfo("Готово", "Данные обновлены.")
 
     def delete_teacher(self):
-        sel = self.listbox.curselection()
-        if not sel:
+        idx = self._selected_index()
+        if idx is None:
             messagebox.showwarning("Нет выбора", "Выберите преподавателя в списке.")
             return
-        idx = sel[0]
         t = self.teachers[idx]
         if messagebox.askyesno("Подтверждение", f"Удалить {t.fio} (#{t.tab_number})?"):
-            del self.teachers[idx]
-            self.refresh_listbox()
+            del self._editable()[idx]
             self.clear_form()
 
     def show_selected_info(self):
-        sel = self.listbox.curselection()
-        if not sel:
+        idx = self._selected_index()
+        if idx is None:
             messagebox.showwarning("Нет выбора", "Выберите преподавателя в списке.")
             return
-        t = self.teachers[sel[0]]
+        t = self.teachers[idx]
         text = t.full() if self.fullinfo_var.get() else t.short()
         messagebox.showinfo("Информация", text)
 
+    def _on_search_typed(self, *args):
+        # каждая клавиша откладывает запуск: ищем, когда ввод затих
+        if self._search_after is not None:
+            self.after_cancel(self._search_after)
+        self._search_after = self.after(SEARCH_DELAY_MS, self.search)
+
     def search(self):
+        if self._search_after is not None:
+            self.after_cancel(self._search_after)
+            self._search_after = None
         q = self.search_var.get().strip().lower()
         if not q:
             self.refresh_listbox()
+            if self._save_thread is None:
+                self.status_var.set("")
             return
-        filtered = [t for t in self.teachers if q in (t.discipline or '').lower()]
-        self.refresh_listbox(filtered)
+        # здесь ничего не копируется: реестр ищет по своему индексу дисциплин,
+        # снимок .tsnap неизменяем (его группы живут, пока модель не изменилась)
+        data, version = self.teachers.data, self.teachers.version
+        if isinstance(data, Snapshot):
+            snap = self._search_snapshot
+            if snap is None or snap.version != version or snap.data is not data:
+                snap = self._search_snapshot = SearchSnapshot(data, version)
+        else:
+            snap = RegistrySearch(data, version)
+        self._live.start(snap, q)  # предыдущий запрос отменяется
+        self._search_waiting = True
+        self.status_var.set("Поиск…")
+        if not self._search_polling:
+            self._search_polling = True
+            self.after(30, self._poll_search)
+
+    def _poll_search(self):
+        try:
+            while True:
+                generation, query, version, rows, done = self._live.results.get_nowait()
+                if not self._live.is_current(generation):
+                    continue  # ответ на устаревший запрос
+                if version != self.teachers.version:
+                    # пока искали, модель изменилась — повторяем по новому снимку
+                    self.search()
+                    continue
+                # первая порция (FIRST_BATCH строк) показывается сразу; полный
+                # результат начинается с неё же, поэтому прокрутка и выделение сохраняются
+                keep = self._filter is not None and self._filter.query == query.casefold()
+                self._filter = FilteredTeachers(self.teachers, query, rows)
+                self.listbox.set_rows(self._filter, reset=not keep)
+                if done:
+                    self._search_waiting = False
+                    self.status_var.set(f"Найдено: {len(rows)}")
+                else:
+                    self.status_var.set(f"Найдено: {len(rows)}+ …")
+        except queue.Empty:
+            pass
+        if self._search_waiting:
+            self.after(30, self._poll_search)
+        else:
+            self._search_polling = False
 
     def reset_search(self):
         self.search_var.set("")
         self.refresh_listbox()
 
     def on_select(self, event=None):
-        sel = self.listbox.curselection()
-        if not sel:
+        idx = self._selected_index()
+        if idx is None:
             return
-        t = self.teachers[sel[0]]
+        t = self.teachers[idx]
         self.vars["tab_number"].set(str(t.tab_number))
         self.vars["fio"].set(t.fio)
         self.vars["gender"].set(t.gender or "М")
@@ -279,9 +506,9 @@ class App(tk.Tk):
         self.vars["gender"].set("М")
         self.vars["experience_years"].set("0")
 
-    def refresh_listbox(self, dataset: Optional[List[Teacher]] = None):
-        if dataset is None:
-            dataset = self.teachers
-        self.listbox.delete(0, tk.END)
-        for t in dataset:
-            self.listbox.insert(tk.END, t.short())
+    def refresh_listbox(self):
+        # стоимость не зависит от числа записей: строки форматируются при показе
+        self._live.cancel()
+        self._search_waiting = False
+        self._filter = None
+        self.listbox.set_rows(self.teachers)
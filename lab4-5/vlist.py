@@ -0,0 +1,202 @@
+"""
+vlist.py — виртуальный список для Tk.
+
+Обычный Listbox хранит строку на каждую запись, и перезаполнение на
+100 тысячах записей занимает секунды. VirtualList держит в Listbox только
+видимые строки: данные — любая последовательность (len и [i]), строка
+для записи формируется функцией fmt при показе. Прокрутка, обновление
+и правка одной строки стоят O(видимых строк), а не O(записей).
+
+Снаружи виджет похож на Listbox: curselection(), selection_set(),
+see() и событие <<ListboxSelect>>; индексы — позиции в данных.
+
+Для данных, которые подгружаются частями, есть on_end: он вызывается,
+когда до конца загруженных строк остаётся меньше экрана; владелец
+дописывает строки в ту же последовательность и вызывает refresh().
+"""
+
+import tkinter as tk
+import tkinter.font as tkfont
+from tkinter import ttk
+from typing import Callable, Optional, Sequence
+
+CACHE_LIMIT = 2000  # сколько отформатированных строк помнить между прокрутками
+
+
+class VirtualList(ttk.Frame):
+    def __init__(self, master, rows: Sequence = (), fmt: Callable = str,
+                 on_end: Optional[Callable[[], None]] = None, **listbox_options):
+        super().__init__(master)
+        self.rowconfigure(0, weight=1)
+        self.columnconfigure(0, weight=1)
+        listbox_options.setdefault("exportselection", False)
+        self._lb = tk.Listbox(self, **listbox_options)
+        self._lb.grid(row=0, column=0, sticky="nsew")
+        self._font = tkfont.Font(font=self._lb.cget("font"))
+        self._scroll = ttk.Scrollbar(self, command=self._on_scroll)
+        self._scroll.grid(row=0, column=1, sticky="ns")
+
+        self._rows = rows
+        self._fmt = fmt
+        self._cache = {}
+        self._top = 0                        # индекс первой видимой строки
+        self._selected: Optional[int] = None
+        self._visible = 1
+        self._on_end = on_end
+        self._end_pending = False
+
+        self._lb.bind("<Configure>", self._on_configure)
+        self._lb.bind("<<ListboxSelect>>", self._on_inner_select)
+        self._lb.bind("<MouseWheel>", self._on_wheel)
+        self._lb.bind("<Button-4>", lambda e: self._scroll_by(-3))
+        self._lb.bind("<Button-5>", lambda e: self._scroll_by(3))
+        for key, step in (("<Up>", -1), ("<Down>", 1)):
+            self._lb.bind(key, lambda e, s=step: self._move_selection(s))
+        self._lb.bind("<Prior>", lambda e: self._move_selection(-self._visible))
+        self._lb.bind("<Next>", lambda e: self._move_selection(self._visible))
+        self._lb.bind("<Home>", lambda e: self._move_selection(-len(self._rows)))
+        self._lb.bind("<End>", lambda e: self._move_selection(len(self._rows)))
+
+    # ------------------------------ данные ---------------------------------
+
+    def set_rows(self, rows: Sequence, fmt: Optional[Callable] = None, reset: bool = True) -> None:
+        """Новые данные; reset=False сохраняет прокрутку и выделение."""
+        self._rows = rows
+        if fmt is not None:
+            self._fmt = fmt
+        self._cache.clear()
+        if reset:
+            self._top = 0
+            self._selected = None
+        self._render()
+
+    def refresh(self) -> None:
+        """Данные могли измениться как угодно — перерисовать видимое."""
+        self._cache.clear()
+        self._render()
+
+    def update_row(self, index: int) -> None:
+        self._cache.pop(index, None)
+        if self._top <= index < self._top + self._visible:
+            self._render()
+
+    def inserted(self, index: int) -> None:
+        """В данные вставлена строка index (остальные сдвинулись вниз)."""
+        if self._selected is not None and index <= self._selected:
+            self._selected += 1
+        self.refresh()
+
+    def removed(self, index: int) -> None:
+        """Из данных удалена строка index."""
+        if self._selected is not None:
+            if index == self._selected:
+                self._selected = None
+            elif index < self._selected:
+                self._selected -= 1
+        self.refresh()
+
+    # ----------------------- как у Listbox ----------------------------------
+
+    def curselection(self) -> tuple:
+        return () if self._selected is None else (self._selected,)
+
+    def selection_set(self, index: int) -> None:
+        self._selected = index
+        self._render()
+
+    def selection_clear(self) -> None:
+        self._selected = None
+        self._render()
+
+    def see(self, index: int) -> None:
+        if index < self._top:
+            self._top = index
+        elif index >= self._top + self._visible:
+            self._top = index - self._visible + 1
+        self._render()
+
+    def yview(self) -> tuple:
+        n = len(self._rows)
+        if not n:
+            return 0.0, 1.0
+        return self._top / n, min(1.0, (self._top + self._visible) / n)
+
+    # ---------------------------- отрисовка ---------------------------------
+
+    def _text(self, index: int) -> str:
+        text = self._cache.get(index)
+        if text is None:
+            if len(self._cache) >= CACHE_LIMIT:
+                self._cache.clear()
+            text = self._cache[index] = self._fmt(self._rows[index])
+        return text
+
+    def _render(self) -> None:
+        n = len(self._rows)
+        self._top = max(0, min(self._top, n - self._visible))
+        end = min(n, self._top + self._visible)
+        lb = self._lb
+        lb.delete(0, tk.END)
+        if end > self._top:
+            lb.insert(0, *(self._text(i) for i in range(self._top, end)))
+        if self._selected is not None:
+            if self._selected >= n:
+                self._selected = None
+            elif self._top <= self._selected < end:
+                lb.selection_set(self._selected - self._top)
+        lb.yview_moveto(0)
+        self._scroll.set(*self.yview())
+        if self._on_end is not None and end + self._visible >= n and not self._end_pending:
+            # не из _render: владелец вызовет refresh(), а значит и _render
+            self._end_pending = True
+            self.after_idle(self._fire_end)
+
+    def _fire_end(self) -> None:
+        self._end_pending = False
+        self._on_end()
+
+    def _on_configure(self, event=None) -> None:
+        lb = self._lb
+        line = self._font.metrics("linespace") + 1
+        border = 2 * (int(lb.cget("borderwidth")) + int(lb.cget("highlightthickness")))
+        visible = max(1, (lb.winfo_height() - border) // line)
+        if visible != self._visible:
+            self._visible = visible
+            self._render()
+
+    # ----------------------------- события ----------------------------------
+
+    def _on_scroll(self, *args) -> None:
+        # протокол Scrollbar: ("moveto", доля) или ("scroll", n, "units"/"pages")
+        if args[0] == "moveto":
+            self._top = int(float(args[1]) * len(self._rows))
+            self._render()
+        elif args[0] == "scroll":
+            step = int(args[1])
+            self._scroll_by(step * self._visible if args[2] == "pages" else step)
+
+    def _scroll_by(self, lines: int) -> str:
+        self._top += lines
+        self._render()
+        return "break"
+
+    def _on_wheel(self, event) -> str:
+        # Windows: delta кратна 120, macOS: мелкие значения
+        delta = event.delta // 120 if abs(event.delta) >= 120 else event.delta
+        return self._scroll_by(-3 * delta)
+
+    def _on_inner_select(self, event=None) -> None:
+        sel = self._lb.curselection()
+        if not sel:
+            return
+        self._selected = self._top + sel[0]
+        self.event_generate("<<ListboxSelect>>")
+
+    def _move_selection(self, step: int) -> str:
+        n = len(self._rows)
+        if n:
+            current = self._selected if self._selected is not None else self._top - (step > 0)
+            self._selected = max(0, min(n - 1, current + step))
+            self.see(self._selected)
+            self.event_generate("<<ListboxSelect>>")
+        return "break"
@@ -0,0 +1,135 @@
+"""
+bench_pool.py — запросы к Postgres с пулом подключений и без него.
+
+Нужна запущенная база из docker-compose.yaml (docker compose up -d).
+Сначала проверяется поведение пула (откат после ошибки, замена оборванного
+подключения, ожидание при занятом пуле), затем замеряются операции в
+секунду: tab_number_exists и «добавление из окна» (проверка номера,
+вставка, перечитывание списка) — каждое через новое подключение
+(get_connection) и через пул (connection).
+
+Запуск: python bench_pool.py [число операций, по умолчанию 2000]
+"""
+
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+import psycopg2
+
+import db
+from pool import ConnectionPool
+
+BENCH_TAB_BASE = 900_000_000  # табельные номера тестовых записей
+
+
+@contextmanager
+def unpooled():
+    conn = db.get_connection()
+    try:
+        with conn:
+            yield conn
+    finally:
+        conn.close()
+
+
+def exists(open_conn, tab_number: int) -> bool:
+    with open_conn() as conn, conn.cursor() as cur:
+        cur.execute("SELECT 1 FROM teachers WHERE tab_number=%s;", (tab_number,))
+        return cur.fetchone() is not None
+
+
+def add_flow(open_conn, tab_number: int) -> None:
+    # как App.add_teacher: проверка, вставка, перечитывание (здесь — одной строки)
+    if exists(open_conn, tab_number):
+        return
+    with open_conn() as conn, conn.cursor() as cur:
+        cur.execute("INSERT INTO teachers(tab_number, fio, gender) VALUES (%s, %s, 'М');",
+                    (tab_number, f"Тест {tab_number}"))
+    with open_conn() as conn, conn.cursor() as cur:
+        cur.execute("SELECT id, fio FROM teachers WHERE tab_number=%s;", (tab_number,))
+        cur.fetchall()
+
+
+def cleanup() -> None:
+    with db.connection() as conn, conn.cursor() as cur:
+        cur.execute("DELETE FROM teachers WHERE tab_number >= %s;", (BENCH_TAB_BASE,))
+
+
+def check_pool() -> None:
+    pool = ConnectionPool(1, 2, timeout=5, health_check_after=0, **db._connect_kwargs())
+    try:
+        # ошибка в блоке — откат, подключение возвращается чистым
+        try:
+            with pool.connection() as conn, conn.cursor() as cur:
+                cur.execute("SELECT * FROM no_such_table;")
+        except psycopg2.ProgrammingError:
+            pass
+        with pool.connection() as conn, conn.cursor() as cur:
+            cur.execute("SELECT 1;")
+            assert cur.fetchone() == (1,)
+
+        # оборванное подключение заменяется новым
+        with pool.connection() as conn, conn.cursor() as cur:
+            cur.execute("SELECT pg_backend_pid();")
+            old_pid = cur.fetchone()[0]
+        with db.connection() as conn, conn.cursor() as cur:
+            cur.execute("SELECT pg_terminate_backend(%s);", (old_pid,))
+        with pool.connection() as conn, conn.cursor() as cur:
+            cur.execute("SELECT pg_backend_pid();")
+            assert cur.fetchone()[0] != old_pid
+
+        # потоков больше, чем подключений: ждут, а не падают
+        errors = []
+
+        def worker():
+            try:
+                for _ in range(20):
+                    with pool.connection() as conn, conn.cursor() as cur:
+                        cur.execute("SELECT pg_sleep(0.001);")
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker) for _ in range(6)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert not errors, errors
+    finally:
+        pool.close()
+    print("пул: откат, замена оборванного подключения и ожидание — ok")
+
+
+def measure(title: str, count: int, op) -> float:
+    t0 = time.perf_counter()
+    for i in range(count):
+        op(i)
+    rate = count / (time.perf_counter() - t0)
+    print(f"{title}: {rate:,.0f} оп/с")
+    return rate
+
+
+def main(argv):
+    count = int(argv[1]) if len(argv) > 1 else 2000
+    db.init_db()
+    cleanup()
+    try:
+        check_pool()
+        raw = measure("exists, новое подключение", count, lambda i: exists(unpooled, i))
+        pooled = measure("exists, пул", count, lambda i: exists(db.connection, i))
+        print(f"  ускорение: x{pooled / raw:.1f}")
+        flows = max(1, count // 4)
+        raw = measure("добавление, новое подключение", flows,
+                      lambda i: add_flow(unpooled, BENCH_TAB_BASE + i))
+        pooled = measure("добавление, пул", flows,
+                         lambda i: add_flow(db.connection, BENCH_TAB_BASE + flows + i))
+        print(f"  ускорение: x{pooled / raw:.1f}")
+    finally:
+        cleanup()
+        db.close_pool()
+
+
+if __name__ == "__main__":
+    main(sys.argv)
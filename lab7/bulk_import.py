@@ -0,0 +1,282 @@
+"""
+bulk_import.py — массовая загрузка преподавателей в Postgres (ЛР7).
+
+Источник — JSON-файл в формате ЛР4-5 (save_teachers: массив записей
+tab_number, fio, gender, birth_date, address, phone, discipline,
+experience_years; необязательное поле department) или любой итератор
+таких словарей / объектов Teacher.
+
+Всё идёт в одной транзакции:
+  1. записи проверяются и потоком уходят через COPY FROM STDIN во
+     временную таблицу (в памяти — только текущий кусок CSV);
+  2. имена кафедр и дисциплин переводятся в id одним соединением со
+     справочниками. Записи с неизвестной кафедрой или дисциплиной
+     отбрасываются (в rejected); с create_refs=True такие кафедры и
+     дисциплины сначала добавляются в справочники;
+  3. строки переносятся в teachers; при совпадении tab_number запись
+     пропускается (on_conflict="skip") или обновляется ("upsert").
+Если tab_number повторяется в самом источнике, берётся первая запись —
+как при открытии файла в ЛР4-5. Записи, которые нельзя положить в
+таблицу (нет пола М/Ж, пустое ФИО и т. п.), не загружаются и считаются
+в rejected; первые из ошибок — в errors.
+
+Запуск: python bulk_import.py файл.json [skip|upsert] [--create-refs]
+"""
+
+import csv
+import io
+import os
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, Iterator, List, Optional, Union
+
+import db
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "lab4-5"))
+from model import PROGRESS_STEP, Teacher, iter_json_array
+
+ON_CONFLICT = ("skip", "upsert")
+MAX_ERRORS = 20          # сколько сообщений об отброшенных записях хранить
+COPY_CHUNK = 256 * 1024  # примерный размер куска CSV, отдаваемого COPY
+INT32_MAX = 2**31 - 1  # верхняя граница колонок INTEGER в Postgres
+
+_COLUMNS = ("tab_number", "fio", "gender", "birth_date", "phone",
+            "experience_years", "department", "subject")
+
+
+@dataclass
+class ImportStats:
+    read: int = 0          # записей в источнике
+    rejected: int = 0      # не прошли проверку
+    inserted: int = 0
+    updated: int = 0
+    skipped: int = 0       # табельный номер уже был (в таблице или выше в источнике)
+    seconds: float = 0.0
+    errors: List[str] = field(default_factory=list)
+
+    @property
+    def rows_per_sec(self) -> float:
+        return self.read / self.seconds if self.seconds else 0.0
+
+    def __str__(self) -> str:
+        return (f"прочитано {self.read}, добавлено {self.inserted}, обновлено {self.updated}, "
+                f"пропущено {self.skipped}, отброшено {self.rejected} "
+                f"за {self.seconds:.2f} с ({self.rows_per_sec:,.0f} записей/с)")
+
+
+def _records(source) -> Iterator[dict]:
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "r", encoding="utf-8") as f:
+            yield from iter_json_array(f)
+        return
+    for item in source:
+        yield item if isinstance(item, dict) else dict(item.to_dict(), department=None)
+
+
+def _row(item: dict) -> tuple:
+    # те же проверки и нормализация, что при вводе в ЛР4-5
+    t = Teacher.from_dict(item)
+    if not t.fio.strip():
+        raise ValueError("ФИО: поле не должно быть пустым.")
+    if t.gender not in ("М", "Ж"):
+        raise ValueError("Пол: в базе обязателен (М/Ж).")
+    # строки Teacher уже перевёл в int; 1.5, true или null в JSON остаются
+    # как есть. Значение вне INTEGER уронило бы весь COPY, а не одну запись
+    for name, value, low in (("Табельный номер", t.tab_number, 1),
+                             ("Стаж (лет)", t.experience_years, 0)):
+        if not isinstance(value, int) or isinstance(value, bool):
+            raise ValueError(f"{name}: ожидается целое число.")
+        if not low <= value <= INT32_MAX:
+            raise ValueError(f"{name}: число должно быть от {low} до {INT32_MAX}.")
+    department = (item.get("department") or "").strip()
+    return (t.tab_number, t.fio.strip(), t.gender,
+            t.birth_date.isoformat() if t.birth_date else None,
+            t.phone or None, t.experience_years,
+            department or None, t.discipline.strip() or None)
+
+
+class _CopySource(io.TextIOBase):
+    """
+    Файлоподобный объект для copy_expert: CSV-строки формируются из
+    записей по мере того, как COPY их читает.
+    """
+
+    def __init__(self, records: Iterable[dict], stats: ImportStats,
+                 progress: Optional[Callable[[int], None]]):
+        self._records = iter(records)
+        self._stats = stats
+        self._progress = progress
+        self._buf = io.StringIO()
+        self._writer = csv.writer(self._buf, lineterminator="\n")
+        self._pending = ""
+
+    def readable(self) -> bool:
+        return True
+
+    def _fill(self) -> bool:
+        stats, writer = self._stats, self._writer
+        for item in self._records:
+            stats.read += 1
+            try:
+                writer.writerow(_row(item))
+            except (ValueError, TypeError, AttributeError) as e:
+                stats.rejected += 1
+                if len(stats.errors) < MAX_ERRORS:
+                    stats.errors.append(f"запись {stats.read}: {e}")
+            if self._progress is not None and stats.read % PROGRESS_STEP == 0:
+                self._progress(stats.read)
+            if self._buf.tell() >= COPY_CHUNK:
+                break
+        chunk = self._buf.getvalue()
+        self._buf.seek(0)
+        self._buf.truncate()
+        self._pending += chunk
+        return bool(chunk)
+
+    def read(self, size: int = -1) -> str:
+        while (size < 0 or len(self._pending) < size) and self._fill():
+            pass
+        if size < 0:
+            size = len(self._pending)
+        out, self._pending = self._pending[:size], self._pending[size:]
+        return out
+
+
+_STAGE = """
+    CREATE TEMP TABLE import_teachers (
+        seq BIGSERIAL,
+        tab_number INTEGER NOT NULL,
+        fio TEXT NOT NULL,
+        gender CHAR(1) NOT NULL,
+        birth_date DATE,
+        phone TEXT,
+        experience_years INTEGER NOT NULL,
+        department TEXT,
+        subject TEXT
+    ) ON COMMIT DROP;
+"""
+
+_REFS = """
+    INSERT INTO departments(name)
+        SELECT DISTINCT department FROM import_teachers WHERE department IS NOT NULL
+        ON CONFLICT (name) DO NOTHING;
+    INSERT INTO subjects(name)
+        SELECT DISTINCT subject FROM import_teachers WHERE subject IS NOT NULL
+        ON CONFLICT (name) DO NOTHING;
+"""
+
+# без create_refs: записи с кафедрой или дисциплиной, которых нет в справочниках;
+# возвращаются только отсутствующие имена (второе — NULL, если оно есть)
+_UNKNOWN_REFS = """
+    WITH unknown AS (
+        SELECT i.seq, i.tab_number,
+               CASE WHEN d.id IS NULL THEN i.department END AS department,
+               CASE WHEN s.id IS NULL THEN i.subject END AS subject
+        FROM import_teachers i
+        LEFT JOIN departments d ON d.name = i.department
+        LEFT JOIN subjects   s ON s.name = i.subject
+    )
+    DELETE FROM import_teachers i
+    USING unknown u
+    WHERE i.seq = u.seq AND (u.department IS NOT NULL OR u.subject IS NOT NULL)
+    RETURNING u.tab_number, u.department, u.subject;
+"""
+
+_MOVE = """
+    WITH src AS (
+        SELECT DISTINCT ON (i.tab_number)
+            i.tab_number, i.fio, i.gender, i.birth_date, i.phone,
+            i.experience_years, d.id AS department_id, s.id AS subject_id
+        FROM import_teachers i
+        LEFT JOIN departments d ON d.name = i.department
+        LEFT JOIN subjects   s ON s.name = i.subject
+        ORDER BY i.tab_number, i.seq
+    ), moved AS (
+        INSERT INTO teachers(
+            tab_number, fio, gender, birth_date, phone,
+            experience_years, department_id, subject_id
+        )
+        SELECT * FROM src
+        ON CONFLICT (tab_number) DO {action}
+        RETURNING (xmax = 0) AS inserted
+    )
+    SELECT count(*) FILTER (WHERE inserted), count(*) FILTER (WHERE NOT inserted),
+           (SELECT count(*) FROM import_teachers)
+    FROM moved;
+"""
+
+_UPSERT = """UPDATE SET
+            fio = EXCLUDED.fio,
+            gender = EXCLUDED.gender,
+            birth_date = EXCLUDED.birth_date,
+            phone = EXCLUDED.phone,
+            experience_years = EXCLUDED.experience_years,
+            department_id = EXCLUDED.department_id,
+            subject_id = EXCLUDED.subject_id"""
+
+
+def import_teachers(
+    source: Union[str, os.PathLike, Iterable],
+    on_conflict: str = "skip",
+    progress: Optional[Callable[[int], None]] = None,
+    create_refs: bool = False,
+) -> ImportStats:
+    """
+    Загружает преподавателей из source (путь к JSON или итератор словарей /
+    Teacher) одной транзакцией. progress(n) вызывается каждые PROGRESS_STEP записей.
+    create_refs — добавлять в справочники неизвестные кафедры и дисциплины;
+    без него такие записи отбрасываются.
+    """
+    if on_conflict not in ON_CONFLICT:
+        raise ValueError(f"on_conflict: ожидается одно из {ON_CONFLICT}.")
+    action = _UPSERT if on_conflict == "upsert" else "NOTHING"
+    stats = ImportStats()
+    t0 = time.perf_counter()
+    with db.connection() as conn, conn.cursor() as cur:
+        cur.execute(_STAGE)
+        cur.copy_expert(
+            f"COPY import_teachers ({', '.join(_COLUMNS)}) FROM STDIN WITH (FORMAT csv)",
+            _CopySource(_records(source), stats, progress),
+            size=COPY_CHUNK,
+        )
+        if create_refs:
+            cur.execute(_REFS)
+        else:
+            cur.execute(_UNKNOWN_REFS)
+            for tab_number, department, subject in cur:
+                stats.rejected += 1
+                if len(stats.errors) < MAX_ERRORS:
+                    missing = [f"{kind} «{name}»" for kind, name in
+                               (("кафедры", department), ("дисциплины", subject)) if name]
+                    stats.errors.append(f"табельный номер {tab_number}: "
+                                        f"в справочниках нет {' и '.join(missing)}")
+        cur.execute(_MOVE.format(action=action))
+        inserted, updated, staged = cur.fetchone()
+    stats.inserted, stats.updated = inserted, updated
+    stats.skipped = staged - inserted - updated
+    stats.seconds = time.perf_counter() - t0
+    return stats
+
+
+def main(argv):
+    create_refs = "--create-refs" in argv
+    argv = [a for a in argv if a != "--create-refs"]
+    if len(argv) not in (2, 3):
+        print("Использование: python bulk_import.py файл.json [skip|upsert] [--create-refs]")
+        return 2
+    db.init_db()
+    try:
+        stats = import_teachers(argv[1], argv[2] if len(argv) == 3 else "skip",
+                                progress=lambda n: print(f"  прочитано {n}", flush=True),
+                                create_refs=create_refs)
+    finally:
+        db.close_pool()
+    print(stats)
+    for e in stats.errors:
+        print("  " + e)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -2,9 +2,19 @@
 db.py — слой доступа к базе Postgres для ЛР7.
 """
 
+import os
+import sys
+import threading
 import psycopg2
+from contextlib import contextmanager
 from datetime import datetime, date
-from typing import List, Tuple, Dict, Any, Optional
+from typing import List, NamedTuple, Tuple, Dict, Any, Optional
+
+from pool import ConnectionPool
+
+# условия запросов — те же, что у реестра ЛР3 (query.py)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "lab3"))
+import query
 
 # Параметры подключения к контейнеру Postgres
 DB_HOST = "localhost"
@@ -13,16 +23,91 @@ DB_NAME = "university"
 DB_USER = "labuser"
 DB_PASS = "labpass"
 
+# Размер пула подключений
+POOL_MIN = 1
+POOL_MAX = 5
+
+# Строк в одной странице list_teachers_page
+PAGE_SIZE = 500
+
+# поле условия/сортировки -> выражение в SQL; в текст запроса попадает только отсюда
+COLUMNS = {
+    "tab_number": "t.tab_number",
+    "fio": "t.fio",
+    "gender": "t.gender",
+    "birth_date": "t.birth_date",
+    "phone": "NULLIF(t.phone, '')",  # пустой телефон — «не указан», как в ЛР3
+    "experience_years": "t.experience_years",
+    "discipline": "s.name",
+    "department": "d.name",
+}
+
+class TeacherRow(NamedTuple):
+    """Строка списка преподавателей (порядок полей — как в _TEACHER_SELECT)."""
+    id: int
+    tab_number: int
+    fio: str
+    gender: str
+    birth_date: Optional[date]
+    phone: Optional[str]
+    experience_years: int
+    department: Optional[str]
+    subject: Optional[str]
+
+
+_TEACHER_SELECT = """
+    SELECT
+        t.id,
+        t.tab_number,
+        t.fio,
+        t.gender,
+        t.birth_date,
+        t.phone,
+        t.experience_years,
+        d.name AS department,
+        s.name AS subject
+    FROM teachers t
+    LEFT JOIN departments d ON d.id = t.department_id
+    LEFT JOIN subjects   s ON s.id = t.subject_id
+"""
+
+
+def _connect_kwargs() -> Dict[str, Any]:
+    return dict(host=DB_HOST, port=DB_PORT, dbname=DB_NAME, user=DB_USER, password=DB_PASS)
+
 
 def get_connection():
-    """Создаёт новое подключение к Postgres."""
-    return psycopg2.connect(
-        host=DB_HOST,
-        port=DB_PORT,
-        dbname=DB_NAME,
-        user=DB_USER,
-        password=DB_PASS,
-    )
+    """Создаёт новое подключение к Postgres (в обход пула)."""
+    return psycopg2.connect(**_connect_kwargs())
+
+
+_pool: Optional[ConnectionPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_pool() -> ConnectionPool:
+    """Общий пул подключений; создаётся при первом обращении."""
+    global _pool
+    with _pool_lock:
+        if _pool is None or _pool.closed:
+            _pool = ConnectionPool(POOL_MIN, POOL_MAX, **_connect_kwargs())
+        return _pool
+
+
+def close_pool() -> None:
+    """Закрыть все подключения пула (при выходе из программы)."""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close()
+            _pool = None
+
+
+@contextmanager
+def connection():
+    """Подключение из пула; при выходе — commit (или rollback при исключении)."""
+    with get_pool().connection() as conn:
+        yield conn
 
 
 def init_db():
@@ -30,7 +115,7 @@ def init_db():
     Создаёт таблицы, если их нет.
     Заполняет справочники кафедр и дисциплин начальными значениями.
     """
-    with get_connection() as conn:
+    with connection() as conn:
         with conn.cursor() as cur:
             # Кафедры
             cur.execute("""
@@ -64,6 +149,15 @@ def init_db():
                 );
             """)
 
+            # Индексы под условия query_teachers (диапазоны и префиксы)
+            cur.execute("CREATE INDEX IF NOT EXISTS teachers_birth_date_idx ON teachers (birth_date);")
+            cur.execute("CREATE INDEX IF NOT EXISTS teachers_experience_idx ON teachers (experience_years);")
+            cur.execute("CREATE INDEX IF NOT EXISTS teachers_fio_idx ON teachers (lower(fio) text_pattern_ops);")
+            # то же выражение, что COLUMNS["phone"], иначе LIKE 'префикс%' индекс не использует
+            cur.execute("DROP INDEX IF EXISTS teachers_phone_idx;")
+            cur.execute("CREATE INDEX IF NOT EXISTS teachers_phone_prefix_idx "
+                        "ON teachers ((NULLIF(phone, '')) text_pattern_ops);")
+
             # Начальные данные для справочников, если пусто
             cur.execute("SELECT COUNT(*) FROM departments;")
             if cur.fetchone()[0] == 0:
@@ -87,19 +181,17 @@ def init_db():
                     ],
                 )
 
-        conn.commit()
-
 
 def list_departments() -> List[Tuple[int, str]]:
     """[(id, 'Кафедра ...'), ...]"""
-    with get_connection() as conn, conn.cursor() as cur:
+    with connection() as conn, conn.cursor() as cur:
         cur.execute("SELECT id, name FROM departments ORDER BY name;")
         return cur.fetchall()
 
 
 def list_subjects() -> List[Tuple[int, str]]:
     """[(id, 'Дисциплина ...'), ...]"""
-    with get_connection() as conn, conn.cursor() as cur:
+    with connection() as conn, conn.cursor() as cur:
         cur.execute("SELECT id, name FROM subjects ORDER BY name;")
         return cur.fetchall()
 
@@ -109,23 +201,8 @@ def list_teachers() -> List[Dict[str, Any]]:
     Возвращает преподавателей в человеко-читаемом виде:
     fio, табельный номер, стаж, Кафедра по имени, Дисциплина по имени.
     """
-    with get_connection() as conn, conn.cursor() as cur:
-        cur.execute("""
-            SELECT
-                t.id,
-                t.tab_number,
-                t.fio,
-                t.gender,
-                t.birth_date,
-                t.phone,
-                t.experience_years,
-                d.name AS department,
-                s.name AS subject
-            FROM teachers t
-            LEFT JOIN departments d ON d.id = t.department_id
-            LEFT JOIN subjects   s ON s.id = t.subject_id
-            ORDER BY t.id;
-        """)
+    with connection() as conn, conn.cursor() as cur:
+        cur.execute(_TEACHER_SELECT + " ORDER BY t.id;")
         rows = cur.fetchall()
         cols = [desc[0] for desc in cur.description]
         # превращаем список tuples в список dict-ов
@@ -133,9 +210,51 @@ def list_teachers() -> List[Dict[str, Any]]:
         return result
 
 
+def list_teachers_page(after_id: Optional[int] = None, limit: int = PAGE_SIZE) -> List[TeacherRow]:
+    """
+    Страница списка по возрастанию id: не больше limit строк с id > after_id
+    (None — с начала). Следующая страница — after_id = id последней строки.
+    Поиск по ключу, а не OFFSET: страница стоит O(limit) по индексу
+    первичного ключа при любом размере таблицы и не съезжает, когда
+    между запросами строки добавляются или удаляются.
+    """
+    with connection() as conn, conn.cursor() as cur:
+        cur.execute(_TEACHER_SELECT + " WHERE t.id > %s ORDER BY t.id LIMIT %s;",
+                    (after_id if after_id is not None else 0, limit))
+        return [TeacherRow._make(row) for row in cur]
+
+
+def query_teachers(
+    where=None,
+    order_by: Optional[str] = None,
+    descending: bool = False,
+    limit: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Преподаватели по условию из query.py (Eq, Range, Prefix, Contains, And, Or),
+    в порядке order_by — как query.run в ЛР3: без значения в конце, при
+    равенстве — по id (при descending — ровно обратный порядок).
+    """
+    condition, params = query.to_sql(where, COLUMNS)
+    direction = "DESC" if descending else "ASC"
+    order = f"t.id {direction}"
+    if order_by is not None:
+        if order_by not in COLUMNS:
+            raise ValueError(f"нельзя сортировать по полю {order_by!r}.")
+        order = f"{COLUMNS[order_by]} {direction} NULLS LAST, " + order
+    sql = f"{_TEACHER_SELECT} WHERE {condition} ORDER BY {order}"
+    if limit is not None:
+        sql += " LIMIT %s"
+        params.append(int(limit))
+    with connection() as conn, conn.cursor() as cur:
+        cur.execute(sql + ";", params)
+        cols = [desc[0] for desc in cur.description]
+        return [dict(zip(cols, row)) for row in cur.fetchall()]
+
+
 def tab_number_exists(tab_number: int) -> bool:
     """Проверка уникальности табельного номера."""
-    with get_connection() as conn, conn.cursor() as cur:
+    with connection() as conn, conn.cursor() as cur:
         cur.execute("SELECT 1 FROM teachers WHERE tab_number=%s;", (tab_number,))
         return cur.fetchone() is not None
 
@@ -150,7 +269,7 @@ def add_teacher(
     department_id: Optional[int],
     subject_id: Optional[int],
 ) -> None:
-    with get_connection() as conn, conn.cursor() as cur:
+    with connection() as conn, conn.cursor() as cur:
         cur.execute(
             """
             INSERT INTO teachers(
@@ -170,10 +289,8 @@ def add_teacher(
                 subject_id,
             ),
         )
-        conn.commit()
 
 
 def delete_teacher(teacher_id: int) -> None:
-    with get_connection() as conn, conn.cursor() as cur:
+    with connection() as conn, conn.cursor() as cur:
         cur.execute("DELETE FROM teachers WHERE id=%s;", (teacher_id,))
-        conn.commit()
@@ -1,3 +1,5 @@
+import os
+import sys
 import tkinter as tk
 from tkinter import ttk, messagebox
 from datetime import datetime
@@ -5,6 +7,10 @@ from typing import Optional
 
 import db  # наш модуль db.py
 
+# виртуальный список из ЛР4-5: в виджете только видимые строки
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "lab4-5"))
+from vlist import VirtualList
+
 
 # ---- простые валидаторы (переиспользуем идею из прошлых лаб) ----
 
@@ -65,6 +71,14 @@ def normalize_phone(value: str) -> str:
     return digits
 
 
+def teacher_line(t: db.TeacherRow) -> str:
+    # Пример строки: "#101 | Иванов И.И. | Кафедра информатики | Программирование | стаж 5 лет"
+    dep = t.department or "—"
+    subj = t.subject or "—"
+    fio = t.fio or "—"
+    return f"#{t.tab_number} | {fio} | {dep} | {subj} | стаж {t.experience_years} лет"
+
+
 # ---- само приложение ----
 
 class App(tk.Tk):
@@ -81,8 +95,10 @@ class App(tk.Tk):
         self.departments = db.list_departments()   # [(id, name), ...]
         self.subjects = db.list_subjects()         # [(id, name), ...]
 
-        # кэш преподавателей (для удаления)
-        self.teachers_cache = []  # список dict из db.list_teachers()
+        # загруженные страницы преподавателей (db.TeacherRow), дальше — по прокрутке
+        self.teachers_cache = []
+        self._last_id = None       # id последней загруженной строки
+        self._exhausted = False    # в базе больше нет строк после _last_id
 
         # сетка окна
         self.columnconfigure(0, weight=2)
@@ -106,13 +122,11 @@ class App(tk.Tk):
         frame.rowconfigure(1, weight=1)
         frame.columnconfigure(0, weight=1)
 
-        ttk.Label(frame, text="Список преподавателей").grid(row=0, column=0, sticky="w")
+        self.list_title = tk.StringVar(value="Список преподавателей")
+        ttk.Label(frame, textvariable=self.list_title).grid(row=0, column=0, sticky="w")
 
-        self.listbox = tk.Listbox(frame, exportselection=False)
-        self.listbox.grid(row=1, column=0, sticky="nsew")
-        scroll = ttk.Scrollbar(frame, command=self.listbox.yview)
-        self.listbox.configure(yscrollcommand=scroll.set)
-        scroll.grid(row=1, column=1, sticky="ns")
+        self.listbox = VirtualList(frame, self.teachers_cache, teacher_line, on_end=self.load_more)
+        self.listbox.grid(row=1, column=0, columnspan=2, sticky="nsew")
 
         btnbar = ttk.Frame(frame)
         btnbar.grid(row=2, column=0, sticky="ew", pady=(8,0))
@@ -189,24 +203,42 @@ class App(tk.Tk):
     # ----------------- Бизнес-логика кнопок -----------------
 
     def refresh_teachers(self):
-        """Запрашивает список из БД, отображает в listbox без id-шников."""
+        """Перечитывает список с начала: только первую страницу, остальное — по прокрутке."""
         try:
-            self.teachers_cache = db.list_teachers()
+            page = db.list_teachers_page(None)
         except Exception as e:
             messagebox.showerror("Ошибка БД", f"Не удалось получить список преподавателей:\n{e}")
             return
 
-        self.listbox.delete(0, tk.END)
-        for t in self.teachers_cache:
-            # Красиво показываем кафедру и дисциплину
-            # Пример строки: "#101 | Иванов И.И. | Кафедра информатики | Программирование | стаж 5 лет"
-            dep = t.get("department") or "—"
-            subj = t.get("subject") or "—"
-            fio = t.get("fio") or "—"
-            tabn = t.get("tab_number")
-            exp = t.get("experience_years")
-            line = f"#{tabn} | {fio} | {dep} | {subj} | стаж {exp} лет"
-            self.listbox.insert(tk.END, line)
+        self.teachers_cache = page
+        self._last_id = page[-1].id if page else None
+        self._exhausted = len(page) < db.PAGE_SIZE
+        self._update_list_title()
+        # строки форматируются только для видимой части списка
+        self.listbox.set_rows(self.teachers_cache)
+
+    def load_more(self):
+        """Следующая страница, когда прокрутка подошла к концу загруженного."""
+        if self._exhausted:
+            return
+        try:
+            page = db.list_teachers_page(self._last_id)
+        except Exception as e:
+            # не повторять ошибку на каждой прокрутке — до «Обновить список»
+            self._exhausted = True
+            messagebox.showerror("Ошибка БД", f"Не удалось получить список преподавателей:\n{e}")
+            return
+
+        if page:
+            self.teachers_cache.extend(page)
+            self._last_id = page[-1].id
+        self._exhausted = len(page) < db.PAGE_SIZE
+        self._update_list_title()
+        self.listbox.refresh()
+
+    def _update_list_title(self):
+        more = "" if self._exhausted else "+"
+        self.list_title.set(f"Список преподавателей ({len(self.teachers_cache)}{more})")
 
     def add_teacher(self):
         """Считать поля из формы, провалидировать, вставить в БД."""
@@ -267,16 +299,19 @@ class App(tk.Tk):
 
         idx = sel[0]
         teacher_row = self.teachers_cache[idx]
-        teacher_id = teacher_row["id"]
-        fio = teacher_row["fio"]
-        tabn = teacher_row["tab_number"]
+        teacher_id = teacher_row.id
+        fio = teacher_row.fio
+        tabn = teacher_row.tab_number
 
         if not messagebox.askyesno("Удаление", f"Удалить {fio} (#{tabn}) из базы?"):
             return
 
         try:
             db.delete_teacher(teacher_id)
-            self.refresh_teachers()
+            # из БД перечитывать не нужно — убираем одну строку
+            del self.teachers_cache[idx]
+            self.listbox.removed(idx)
+            self._update_list_title()
             messagebox.showinfo("Готово", "Удалено.")
         except Exception as e:
             messagebox.showerror("Ошибка БД", f"Не удалось удалить:\n{e}")
@@ -292,4 +327,7 @@ class App(tk.Tk):
 
 def run_gui():
     app = App()
-    app.mainloop()
+    try:
+        app.mainloop()
+    finally:
+        db.close_pool()
@@ -0,0 +1,143 @@
+"""
+pool.py — пул подключений к Postgres для ЛР7.
+
+Открытие подключения psycopg2 — это TCP и аутентификация, дороже самого
+запроса. ConnectionPool открывает minconn подключений сразу, остальные —
+по требованию, но не больше maxconn одновременно, и выдаёт их через
+контекстный менеджер:
+
+    with pool.connection() as conn, conn.cursor() as cur:
+        cur.execute(...)
+
+При выходе из блока транзакция фиксируется (при исключении — откатывается),
+и подключение возвращается в пул. Подключение, которое простояло без дела
+дольше HEALTH_CHECK_AFTER секунд, перед выдачей проверяется запросом
+SELECT 1; оборванное закрывается и заменяется новым. Если все maxconn
+подключений заняты, вызов ждёт до timeout секунд.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, List, Optional, Tuple
+
+import psycopg2
+import psycopg2.extensions
+import psycopg2.pool
+
+HEALTH_CHECK_AFTER = 30.0  # секунд простоя, после которых подключение проверяется
+WAIT_TIMEOUT = 10.0        # сколько ждать свободного подключения
+
+
+def _close_quietly(conn) -> None:
+    try:
+        conn.close()
+    except psycopg2.Error:
+        pass
+
+
+class ConnectionPool:
+    """
+    connect — функция без аргументов, открывающая подключение (по умолчанию
+    psycopg2.connect(**connect_kwargs)); её можно подменить, например в тестах.
+    """
+
+    def __init__(self, minconn: int = 1, maxconn: int = 5, timeout: float = WAIT_TIMEOUT,
+                 health_check_after: float = HEALTH_CHECK_AFTER,
+                 connect: Optional[Callable[[], "psycopg2.extensions.connection"]] = None,
+                 **connect_kwargs):
+        if not 0 <= minconn <= maxconn or maxconn < 1:
+            raise ValueError("нужно 0 <= minconn <= maxconn и maxconn >= 1.")
+        self._connect = connect or (lambda: psycopg2.connect(**connect_kwargs))
+        # выданных подключений не больше maxconn: при занятом пуле — ожидание
+        self._free = threading.BoundedSemaphore(maxconn)
+        self._timeout = timeout
+        self._check_after = health_check_after
+        self._lock = threading.Lock()
+        # свободные подключения и время возврата; закрытые сюда не попадают,
+        # поэтому список не длиннее maxconn
+        self._idle: List[Tuple["psycopg2.extensions.connection", float]] = []
+        self._closed = False
+        now = time.monotonic()
+        for _ in range(minconn):
+            self._idle.append((self._connect(), now))
+
+    def _healthy(self, conn, idle_since: float) -> bool:
+        if conn.closed:
+            return False
+        if time.monotonic() - idle_since < self._check_after:
+            return True
+        try:
+            with conn.cursor() as cur:
+                cur.execute("SELECT 1;")
+            conn.rollback()
+            return True
+        except (psycopg2.OperationalError, psycopg2.InterfaceError):
+            return False
+
+    def _get(self):
+        while True:
+            with self._lock:
+                if self._closed:
+                    raise psycopg2.pool.PoolError("пул подключений закрыт.")
+                # последнее возвращённое — скорее всего живое и без проверки
+                item = self._idle.pop() if self._idle else None
+            if item is None:
+                return self._connect()
+            conn, idle_since = item
+            if self._healthy(conn, idle_since):
+                return conn
+            # оборванное подключение закрывается, берётся следующее или новое
+            _close_quietly(conn)
+
+    def _put(self, conn) -> None:
+        broken = bool(conn.closed)
+        if not broken and conn.info.transaction_status != psycopg2.extensions.TRANSACTION_STATUS_IDLE:
+            try:
+                conn.rollback()
+            except psycopg2.Error:
+                broken = True
+        with self._lock:
+            if not broken and not self._closed:
+                self._idle.append((conn, time.monotonic()))
+                return
+        _close_quietly(conn)
+
+    @contextmanager
+    def connection(self) -> Iterator["psycopg2.extensions.connection"]:
+        if not self._free.acquire(timeout=self._timeout):
+            raise psycopg2.pool.PoolError(f"нет свободного подключения за {self._timeout:g} с.")
+        try:
+            conn = self._get()
+            try:
+                yield conn
+                conn.commit()
+            except BaseException:
+                # у оборванного подключения откатывать нечего — пусть дойдёт исходная ошибка
+                if not conn.closed:
+                    try:
+                        conn.rollback()
+                    except psycopg2.Error:
+                        pass
+                raise
+            finally:
+                self._put(conn)
+        finally:
+            self._free.release()
+
+    def close(self) -> None:
+        """Закрыть свободные подключения; выданные закроются при возврате."""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for conn, _ in idle:
+            _close_quietly(conn)
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    @property
+    def idle_count(self) -> int:
+        with self._lock:
+            return len(self._idle)
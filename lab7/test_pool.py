@@ -0,0 +1,210 @@
+"""
+test_pool.py — проверка ConnectionPool без сервера Postgres.
+
+Подключения подменяются FakeConnection через параметр connect. Если
+psycopg2 не установлен, на время теста подставляется модуль с нужными
+пулу именами (исключения, TRANSACTION_STATUS_IDLE, PoolError).
+
+Запуск: python -m unittest test_pool   (из каталога lab7)
+"""
+
+import sys
+import threading
+import time
+import types
+import unittest
+
+try:
+    import psycopg2
+    import psycopg2.extensions
+    import psycopg2.pool
+except ImportError:
+    psycopg2 = types.ModuleType("psycopg2")
+    psycopg2.Error = type("Error", (Exception,), {})
+    psycopg2.OperationalError = type("OperationalError", (psycopg2.Error,), {})
+    psycopg2.InterfaceError = type("InterfaceError", (psycopg2.Error,), {})
+    psycopg2.extensions = types.ModuleType("psycopg2.extensions")
+    psycopg2.extensions.TRANSACTION_STATUS_IDLE = 0
+    psycopg2.pool = types.ModuleType("psycopg2.pool")
+    psycopg2.pool.PoolError = type("PoolError", (psycopg2.Error,), {})
+    sys.modules.update({"psycopg2": psycopg2, "psycopg2.extensions": psycopg2.extensions,
+                        "psycopg2.pool": psycopg2.pool})
+
+from pool import ConnectionPool
+
+IDLE = psycopg2.extensions.TRANSACTION_STATUS_IDLE
+IN_TRANSACTION = 2  # TRANSACTION_STATUS_INTRANS
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params=None):
+        if self.conn.closed or self.conn.dead:
+            raise psycopg2.OperationalError("server closed the connection unexpectedly")
+        self.conn.executed.append(sql)
+        self.conn.info.transaction_status = IN_TRANSACTION
+
+
+class FakeConnection:
+    def __init__(self):
+        self.closed = 0
+        self.dead = False  # сервер оборвал подключение, а клиент ещё не знает
+        self.executed = []
+        self.commits = self.rollbacks = 0
+        self.info = types.SimpleNamespace(transaction_status=IDLE)
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def commit(self):
+        self.commits += 1
+        self.info.transaction_status = IDLE
+
+    def rollback(self):
+        if self.closed:
+            raise psycopg2.InterfaceError("connection already closed")
+        self.rollbacks += 1
+        self.info.transaction_status = IDLE
+
+    def close(self):
+        self.closed = 1
+
+
+class Connector:
+    """connect для пула: считает открытые подключения."""
+
+    def __init__(self):
+        self.opened = []
+        self._lock = threading.Lock()
+
+    def __call__(self):
+        conn = FakeConnection()
+        with self._lock:
+            self.opened.append(conn)
+        return conn
+
+    def open_count(self):
+        return sum(1 for c in self.opened if not c.closed)
+
+
+class ConnectionPoolTest(unittest.TestCase):
+    def make_pool(self, minconn=1, maxconn=2, **kwargs):
+        self.connector = Connector()
+        pool = ConnectionPool(minconn, maxconn, connect=self.connector, **kwargs)
+        self.addCleanup(pool.close)
+        return pool
+
+    def test_checkout_and_return(self):
+        pool = self.make_pool()
+        self.assertEqual(len(self.connector.opened), 1)  # minconn открыты сразу
+        with pool.connection() as first, first.cursor() as cur:
+            cur.execute("SELECT 1;")
+        self.assertEqual(first.commits, 1)
+        with pool.connection() as second:
+            pass
+        self.assertIs(second, first)
+        self.assertEqual(len(self.connector.opened), 1)
+        self.assertEqual(pool.idle_count, 1)
+
+    def test_error_rolls_back_and_returns_connection(self):
+        pool = self.make_pool()
+        with self.assertRaises(ZeroDivisionError):
+            with pool.connection() as conn, conn.cursor() as cur:
+                cur.execute("INSERT ...")
+                1 / 0
+        self.assertEqual((conn.commits, conn.rollbacks), (0, 1))
+        self.assertEqual(conn.info.transaction_status, IDLE)
+        with pool.connection() as again:
+            pass
+        self.assertIs(again, conn)
+
+    def test_health_check_replaces_dead_connection(self):
+        pool = self.make_pool(health_check_after=0)
+        with pool.connection() as conn:
+            pass
+        conn.dead = True
+        with pool.connection() as fresh, fresh.cursor() as cur:
+            cur.execute("SELECT 2;")
+        self.assertIsNot(fresh, conn)
+        self.assertTrue(conn.closed)
+        self.assertEqual(pool.idle_count, 1)
+
+    def test_recently_used_connection_is_not_checked(self):
+        pool = self.make_pool(health_check_after=60)
+        with pool.connection() as conn:
+            pass
+        with pool.connection() as again:
+            pass
+        self.assertIs(again, conn)
+        self.assertNotIn("SELECT 1;", conn.executed)
+
+    def test_connection_closed_during_use_is_discarded(self):
+        pool = self.make_pool()
+        with self.assertRaises(psycopg2.OperationalError):
+            with pool.connection() as conn, conn.cursor() as cur:
+                conn.close()
+                cur.execute("SELECT 1;")
+        self.assertEqual(pool.idle_count, 0)
+        with pool.connection() as fresh:
+            pass
+        self.assertIsNot(fresh, conn)
+
+    def test_semaphore_bounds_checked_out_connections(self):
+        pool = self.make_pool(minconn=0, maxconn=2, timeout=0.05)
+        with pool.connection(), pool.connection():
+            with self.assertRaises(psycopg2.pool.PoolError):
+                with pool.connection():
+                    pass
+        self.assertEqual(len(self.connector.opened), 2)
+
+    def test_threads_wait_instead_of_exceeding_maxconn(self):
+        pool = self.make_pool(minconn=0, maxconn=2, timeout=5)
+        in_use, peak, errors = 0, 0, []
+        lock = threading.Lock()
+
+        def worker():
+            nonlocal in_use, peak
+            try:
+                for _ in range(20):
+                    with pool.connection():
+                        with lock:
+                            in_use += 1
+                            peak = max(peak, in_use)
+                        time.sleep(0.001)
+                        with lock:
+                            in_use -= 1
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker) for _ in range(6)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(errors, [])
+        self.assertLessEqual(peak, 2)
+        self.assertLessEqual(len(self.connector.opened), 2)
+        self.assertLessEqual(pool.idle_count, 2)
+
+    def test_close(self):
+        pool = self.make_pool(minconn=2, maxconn=3)
+        with pool.connection() as held:
+            pool.close()
+            self.assertEqual(pool.idle_count, 0)
+        self.assertTrue(held.closed)  # выданное закрывается при возврате
+        self.assertEqual(self.connector.open_count(), 0)
+        with self.assertRaises(psycopg2.pool.PoolError):
+            with pool.connection():
+                pass
+
+
+if __name__ == "__main__":
+    unittest.main()